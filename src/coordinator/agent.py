@@ -6,7 +6,7 @@ from typing import Dict, Any, List, Optional
 from pathlib import Path
 from PIL import Image
 
-from src.utils.gemini_client import GeminiClient
+from src.utils.gemini_client import get_default_client
 from src.utils.document_parser import DocumentParser
 
 
@@ -15,7 +15,7 @@ class ITSG33Coordinator:
 
     def __init__(self):
         """Initialize coordinator."""
-        self.gemini = GeminiClient()
+        self.gemini = get_default_client()
         self.doc_parser = DocumentParser()
         self.controls_data = self._load_controls()
 
@@ -4,6 +4,7 @@ import os
 import json
 import uuid
 import asyncio
+import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime
@@ -19,12 +20,15 @@ from src.utils.document_parser import DocumentParser
 from src.utils.storage import StorageManager
 from src.utils.word_generator import WordReportGenerator
 from src.utils import auth
+from src import models
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 STATIC_DIR = PROJECT_ROOT / "static"
 DOCS_DIR = PROJECT_ROOT / "docs"
 
+logger = logging.getLogger(__name__)
+
 # Initialize FastAPI app
 app = FastAPI(
     title="ITSG-33 Accreditation System",
@@ -54,11 +58,27 @@ async def _purge_deleted_loop() -> None:
 @app.on_event("startup")
 async def schedule_purge_task() -> None:
     """Schedule background purge task on startup."""
+    models.preload()
     auth.init_auth_db()
     auth.bootstrap_admin()
+    # One Argon2 hash takes tens of milliseconds; keep it off the event loop
+    hash_seconds = await auth.measure_password_hash_seconds_async()
+    logger.info(
+        "Argon2 self-test: %.0f ms per hash (t=%d, m=%d KiB, p=%d)",
+        hash_seconds * 1000,
+        auth.ARGON2_TIME_COST,
+        auth.ARGON2_MEMORY_COST_KIB,
+        auth.ARGON2_PARALLELISM,
+    )
     asyncio.create_task(_purge_deleted_loop())
 
 
+@app.on_event("shutdown")
+async def flush_storage() -> None:
+    """Write out any metadata changes still waiting to be flushed."""
+    await storage.flush()
+
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -124,10 +144,15 @@ async def auth_middleware(request: Request, call_next):
 
 from src.utils.localizer import Localizer
 
+# Storage locations; same names as the coordinator config fields
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "./uploads")
+OUTPUT_DIR = os.getenv("OUTPUT_DIR", "./outputs")
+DATA_DIR = os.getenv("DATA_DIR", "./data")
+
 # Initialize components
 coordinator = ITSG33Coordinator()
-doc_parser = DocumentParser()
-storage = StorageManager()
+doc_parser = DocumentParser(upload_dir=UPLOAD_DIR)
+storage = StorageManager(upload_dir=UPLOAD_DIR, output_dir=OUTPUT_DIR, data_dir=DATA_DIR)
 word_generator = WordReportGenerator()
 localizer = Localizer()
 
@@ -301,7 +326,9 @@ async def system_status():
 async def login(payload: LoginRequest, request: Request):
     """Authenticate a user and create a session."""
     user = auth.get_user_by_email(payload.email)
-    if not user or not auth.verify_password(user["password_hash"], payload.password):
+    if not user or not await auth.verify_password_async(
+        user["password_hash"], payload.password, user_id=user["id"]
+    ):
         auth.log_audit(None, "login_failed", payload.email, {"email": payload.email})
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
@@ -370,11 +397,11 @@ async def change_password(payload: ChangePasswordRequest, request: Request):
     if not user:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    if not auth.verify_password(user["password_hash"], payload.current_password):
+    if not await auth.verify_password_async(user["password_hash"], payload.current_password):
         raise HTTPException(status_code=400, detail="Current password invalid")
 
     try:
-        auth.set_user_password(user["id"], payload.new_password, force_reset=False)
+        await auth.set_user_password_async(user["id"], payload.new_password, force_reset=False)
         auth.set_user_force_reset(user["id"], False)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -391,7 +418,9 @@ async def reset_password(payload: ResetPasswordRequest, request: Request):
         raise HTTPException(status_code=404, detail="User not found")
 
     try:
-        auth.set_user_password(user["id"], payload.temporary_password, force_reset=True)
+        await auth.set_user_password_async(
+            user["id"], payload.temporary_password, force_reset=True
+        )
         auth.set_user_force_reset(user["id"], True)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -426,7 +455,7 @@ async def create_user(payload: CreateUserRequest, request: Request):
     if not payload.roles:
         raise HTTPException(status_code=400, detail="At least one role is required")
     try:
-        user = auth.create_user(payload.email, payload.password, payload.roles)
+        user = await auth.create_user_async(payload.email, payload.password, payload.roles)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
     auth.log_audit(request.state.user["id"], "user_created", user["id"], {"roles": payload.roles})
@@ -1133,7 +1162,7 @@ async def get_assessment_history(assessment_id: str, request: Request):
     if assessment_data.get("results"):
         results = assessment_data.get("results", {})
         current_run = {
-            "run_id": len(history) + 1,
+            "run_id": history[-1]["run_id"] + 1 if history else 1,
             "completed_at": assessment_data.get("updated_at"),
             "is_current": True,
             "document_count": len(assessment_data.get("documents", [])),
@@ -1,8 +1,14 @@
 """Helper tools for Report Generator MCP Server."""
 
+import io
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
 from typing import Dict, List, Any
 from datetime import datetime
 
+from src.models.controls import CONTROL_FAMILY_NAMES
+from src.models.evidence import Gap, GapSeverity
+
 
 def format_date(dt: datetime) -> str:
     """Format datetime for reports."""
@@ -92,6 +98,13 @@ def calculate_summary_statistics(
     }
 
 
+# Control family summary table row; status emoji indexed by (rate >= 50) + (rate >= 80)
+_FAMILY_ROW_TEMPLATE = (
+    "| {code} | {name} | {total} | {implemented} | {partial} | {rate}% | {emoji} |"
+)
+_STATUS_EMOJI = ("❌", "⚠️", "✅")
+
+
 def format_control_family_summary(
     family_code: str,
     family_name: str,
@@ -113,16 +126,35 @@ def format_control_family_summary(
     partial = stats.get("partial", 0)
 
     if total > 0:
-        rate = round(((implemented + partial * 0.5) / total) * 100, 1)
+        # Integer half-up rounding to tenths of a percent
+        rate = ((2 * implemented + partial) * 1000 + total) // (2 * total) / 10
     else:
         rate = 0
 
-    status_emoji = "✅" if rate >= 80 else "⚠️" if rate >= 50 else "❌"
+    return _FAMILY_ROW_TEMPLATE.format_map({
+        "code": family_code,
+        "name": family_name,
+        "total": total,
+        "implemented": implemented,
+        "partial": partial,
+        "rate": rate,
+        "emoji": _STATUS_EMOJI[(rate >= 50) + (rate >= 80)],
+    })
+
+
+# Findings sections in report order (Informational gaps are not listed)
+_FINDINGS_SECTIONS = (
+    (GapSeverity.CRITICAL, "### Critical Findings\n"),
+    (GapSeverity.HIGH, "\n### High Severity Findings\n"),
+    (GapSeverity.MEDIUM, "\n### Medium Severity Findings\n"),
+    (GapSeverity.LOW, "\n### Low Severity Findings\n"),
+)
 
-    return f"| {family_code} | {family_name} | {total} | {implemented} | {partial} | {rate}% | {status_emoji} |"
+# One numbered finding line: index, control ID, description
+_FINDING_LINE = "%d. **%s**: %s\n"
 
 
-def generate_findings_section(gaps: List[Dict[str, Any]]) -> str:
+def generate_findings_section(gaps: List[Gap]) -> str:
     """
     Generate findings section for report.
 
@@ -132,61 +164,20 @@ def generate_findings_section(gaps: List[Dict[str, Any]]) -> str:
     Returns:
         Formatted findings section
     """
-    sections = []
-
-    # Group by severity
-    critical = [g for g in gaps if g.get("severity", "").lower() == "critical"]
-    high = [g for g in gaps if g.get("severity", "").lower() == "high"]
-    medium = [g for g in gaps if g.get("severity", "").lower() == "medium"]
-    low = [g for g in gaps if g.get("severity", "").lower() == "low"]
-
-    if critical:
-        sections.append("### Critical Findings\n")
-        for i, gap in enumerate(critical, 1):
-            sections.append(
-                f"{i}. **{gap.get('control_id', 'Unknown')}**: {gap.get('description', 'No description')}\n"
-            )
-
-    if high:
-        sections.append("\n### High Severity Findings\n")
-        for i, gap in enumerate(high, 1):
-            sections.append(
-                f"{i}. **{gap.get('control_id', 'Unknown')}**: {gap.get('description', 'No description')}\n"
-            )
-
-    if medium:
-        sections.append("\n### Medium Severity Findings\n")
-        for i, gap in enumerate(medium, 1):
-            sections.append(
-                f"{i}. **{gap.get('control_id', 'Unknown')}**: {gap.get('description', 'No description')}\n"
-            )
-
-    if low:
-        sections.append("\n### Low Severity Findings\n")
-        for i, gap in enumerate(low, 1):
-            sections.append(
-                f"{i}. **{gap.get('control_id', 'Unknown')}**: {gap.get('description', 'No description')}\n"
+    # Sort once, most severe first (stable, so input order is kept within a
+    # severity), then slice each severity's contiguous run
+    ordered = sorted(gaps, key=attrgetter("severity"), reverse=True)
+    keys = [-gap.severity for gap in ordered]  # ascending, for bisect
+
+    buf = io.StringIO()
+    for severity, heading in _FINDINGS_SECTIONS:
+        start = bisect_left(keys, -severity)
+        end = bisect_right(keys, -severity, start)
+        if start < end:
+            buf.write(heading)
+            buf.writelines(
+                _FINDING_LINE % (i, gap.control_id, gap.description)
+                for i, gap in enumerate(ordered[start:end], 1)
             )
 
-    return "".join(sections)
-
-
-CONTROL_FAMILY_NAMES = {
-    "AC": "Access Control",
-    "AT": "Awareness and Training",
-    "AU": "Audit and Accountability",
-    "CA": "Assessment, Authorization, and Monitoring",
-    "CM": "Configuration Management",
-    "CP": "Contingency Planning",
-    "IA": "Identification and Authentication",
-    "IR": "Incident Response",
-    "MA": "Maintenance",
-    "MP": "Media Protection",
-    "PE": "Physical and Environmental Protection",
-    "PL": "Planning",
-    "PS": "Personnel Security",
-    "RA": "Risk Assessment",
-    "SA": "System and Services Acquisition",
-    "SC": "System and Communications Protection",
-    "SI": "System and Information Integrity",
-}
+    return buf.getvalue()
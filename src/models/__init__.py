@@ -1,39 +1,63 @@
-"""Data models for ITSG-33 system."""
-
-from .controls import (
-    Control,
-    ControlFamily,
-    ControlMapping,
-    SystemCategorization,
-    SecurityProfile
-)
-from .assessment import (
-    Assessment,
-    AssessmentStatus,
-    AssessmentResult,
-    ControlAssessment
-)
-from .evidence import (
-    Evidence,
-    EvidenceType,
-    EvidenceAssessment,
-    Gap,
-    GapSeverity
-)
-
-__all__ = [
-    "Control",
-    "ControlFamily",
-    "ControlMapping",
-    "SystemCategorization",
-    "SecurityProfile",
-    "Assessment",
-    "AssessmentStatus",
-    "AssessmentResult",
-    "ControlAssessment",
-    "Evidence",
-    "EvidenceType",
-    "EvidenceAssessment",
-    "Gap",
-    "GapSeverity",
-]
+"""Data models for ITSG-33 system.
+
+Models are imported lazily (PEP 562) so callers that need a single model do not
+pay for building every pydantic class in the package.
+"""
+
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "Control": "controls",
+    "ControlFamily": "controls",
+    "ControlMapping": "controls",
+    "SystemCategorization": "controls",
+    "SecurityProfile": "controls",
+    "Assessment": "assessment",
+    "AssessmentStatus": "assessment",
+    "AssessmentResult": "assessment",
+    "ControlAssessment": "assessment",
+    "Evidence": "evidence",
+    "EvidenceType": "evidence",
+    "EvidenceAssessment": "evidence",
+    "Gap": "evidence",
+    "GapSeverity": "evidence",
+}
+
+_SUBMODULES = ("controls", "assessment", "evidence")
+
+__all__ = [*_LAZY, "preload"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        module = importlib.import_module(f".{_LAZY[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def preload() -> None:
+    """Import every model module and finish any pending pydantic schema builds.
+
+    pydantic v2 compiles validators when a class is defined, so this mostly
+    forces the lazy imports above. The app's startup hook calls it so the
+    first request does not pay for the imports and schema builds.
+    """
+    from pydantic import BaseModel
+
+    for submodule in _SUBMODULES:
+        module = importlib.import_module(f".{submodule}", __name__)
+        for value in vars(module).values():
+            if (
+                isinstance(value, type)
+                and issubclass(value, BaseModel)
+                and value.__module__ == module.__name__
+            ):
+                value.model_rebuild()
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY))
@@ -5,6 +5,8 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pydantic import BaseModel, Field
 
+from .evidence import Gap
+
 
 class AssessmentStatus(str, Enum):
     """Assessment status values."""
@@ -59,7 +61,7 @@ class AssessmentResult(BaseModel):
     control_assessments: List[ControlAssessment] = Field(
         default_factory=list, description="Individual control assessments"
     )
-    gaps: List[Dict[str, Any]] = Field(default_factory=list, description="Identified gaps")
+    gaps: List[Gap] = Field(default_factory=list, description="Identified gaps")
     recommendations: List[str] = Field(
         default_factory=list, description="Overall recommendations"
     )
@@ -71,9 +73,10 @@ class AssessmentResult(BaseModel):
         if self.total_controls == 0:
             return 0.0
 
-        # Full implementation = 100%, Partial = 50%
-        score = self.implemented_count + (self.partial_count * 0.5)
-        return round((score / self.total_controls) * 100, 2)
+        # Full implementation = 100%, Partial = 50%. Work in doubled integer
+        # points and round half-up to hundredths of a percent without float round()
+        score_x2 = 2 * self.implemented_count + self.partial_count
+        return (score_x2 * 10000 + self.total_controls) // (2 * self.total_controls) / 100
 
 
 class Assessment(BaseModel):
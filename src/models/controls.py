@@ -1,6 +1,7 @@
 """Data models for ITSG-33 security controls."""
 
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional, List, Dict, Any
 from pydantic import BaseModel, Field
 
@@ -27,7 +28,7 @@ class ControlFamily(str, Enum):
     SI = "SI"  # System and Information Integrity
 
 
-CONTROL_FAMILY_NAMES = {
+_CONTROL_FAMILY_NAMES = {
     ControlFamily.AC: "Access Control",
     ControlFamily.AT: "Awareness and Training",
     ControlFamily.AU: "Audit and Accountability",
@@ -47,6 +48,12 @@ CONTROL_FAMILY_NAMES = {
     ControlFamily.SI: "System and Information Integrity",
 }
 
+# Read-only mapping shared across modules, keyed by family code. ControlFamily
+# members are str-valued, so they look up the same entries.
+CONTROL_FAMILY_NAMES = MappingProxyType(
+    {family.value: name for family, name in _CONTROL_FAMILY_NAMES.items()}
+)
+
 
 class SecurityProfile(int, Enum):
     """ITSG-33 Security Profiles."""
@@ -3,7 +3,7 @@
 from enum import Enum, IntEnum
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 
 
 class EvidenceType(str, Enum):
@@ -73,25 +73,25 @@ EVIDENCE_CATEGORY_MAP: Dict[str, EvidenceStrength] = {
 }
 
 
+# Plain int-keyed views so tier lookups never construct an EvidenceStrength
+_SCORES_BY_TIER: Dict[int, int] = {int(k): v for k, v in EVIDENCE_STRENGTH_SCORES.items()}
+_LABELS_BY_TIER: Dict[int, str] = {int(k): v for k, v in EVIDENCE_STRENGTH_LABELS.items()}
+_MACHINE_VERIFIABLE_TIERS = frozenset({1, 2, 3, 4})
+
+
 def get_strength_score(tier: int) -> int:
     """Get numeric score (0-100) for evidence strength tier."""
-    try:
-        return EVIDENCE_STRENGTH_SCORES.get(EvidenceStrength(tier), 20)
-    except ValueError:
-        return 20  # Default to lowest score for invalid tiers
+    return _SCORES_BY_TIER.get(tier, 20)  # Default to lowest score for invalid tiers
 
 
 def get_strength_label(tier: int) -> str:
     """Get human-readable label for evidence strength tier."""
-    try:
-        return EVIDENCE_STRENGTH_LABELS.get(EvidenceStrength(tier), "Unknown")
-    except ValueError:
-        return "Unknown"
+    return _LABELS_BY_TIER.get(tier, "Unknown")
 
 
 def is_machine_verifiable(tier: int) -> bool:
     """Check if evidence type is machine-verifiable (tiers 1-4)."""
-    return 1 <= tier <= 4
+    return tier in _MACHINE_VERIFIABLE_TIERS
 
 
 def get_strength_from_category(category: str) -> int:
@@ -103,6 +103,8 @@ def get_strength_from_category(category: str) -> int:
 class Evidence(BaseModel):
     """Evidence item."""
 
+    model_config = ConfigDict(frozen=True)
+
     evidence_id: str = Field(..., description="Unique evidence ID")
     name: str = Field(..., description="Evidence name")
     type: EvidenceType = Field(..., description="Type of evidence")
@@ -119,6 +121,8 @@ class Evidence(BaseModel):
 class EvidenceAssessment(BaseModel):
     """Assessment of evidence for a control."""
 
+    model_config = ConfigDict(frozen=True)
+
     evidence_id: str = Field(..., description="Evidence ID")
     control_id: str = Field(..., description="Control ID")
     relevance: str = Field(..., description="How relevant (High, Medium, Low)")
@@ -133,19 +137,36 @@ class EvidenceAssessment(BaseModel):
     assessed_at: datetime = Field(default_factory=datetime.utcnow)
 
 
-class GapSeverity(str, Enum):
-    """Gap severity levels."""
+class GapSeverity(IntEnum):
+    """Gap severity levels (higher is more severe).
+
+    Stored as integers so gaps sort by severity with a plain int compare;
+    str() and every Gap dump (python and JSON mode) keep the original
+    title-cased labels.
+    """
+
+    CRITICAL = 4
+    HIGH = 3
+    MEDIUM = 2
+    LOW = 1
+    INFORMATIONAL = 0
+
+    def __str__(self) -> str:
+        return self.name.title()
 
-    CRITICAL = "Critical"
-    HIGH = "High"
-    MEDIUM = "Medium"
-    LOW = "Low"
-    INFORMATIONAL = "Informational"
+    @classmethod
+    def _missing_(cls, value: Any) -> Optional["GapSeverity"]:
+        # Accept labels such as "High" or "critical" from JSON payloads
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
 
 class Gap(BaseModel):
     """Identified gap in control implementation or evidence."""
 
+    model_config = ConfigDict(frozen=True)
+
     gap_id: str = Field(..., description="Unique gap ID")
     control_id: str = Field(..., description="Related control ID")
     control_name: str = Field(..., description="Control name")
@@ -161,6 +182,10 @@ class Gap(BaseModel):
     identified_at: datetime = Field(default_factory=datetime.utcnow)
     status: str = Field("Open", description="Gap status (Open, In Progress, Closed)")
 
+    @field_serializer("severity")
+    def _serialize_severity(self, severity: GapSeverity) -> str:
+        return str(severity)
+
 
 class GapAnalysisResult(BaseModel):
     """Result of gap analysis."""
@@ -1,7 +1,13 @@
 """Utility functions for ITSG-33 system."""
 
-from .gemini_client import GeminiClient, GeminiConfig
+from .gemini_client import GeminiClient, GeminiConfig, get_default_client
 from .document_parser import DocumentParser
 from .storage import StorageManager
 
-__all__ = ["GeminiClient", "GeminiConfig", "DocumentParser", "StorageManager"]
+__all__ = [
+    "GeminiClient",
+    "GeminiConfig",
+    "get_default_client",
+    "DocumentParser",
+    "StorageManager",
+]
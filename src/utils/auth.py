@@ -2,46 +2,114 @@
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import hmac
 import json
+import logging
 import os
+import queue
+import secrets
 import sqlite3
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from itsdangerous import BadSignature, URLSafeSerializer
 
+logger = logging.getLogger(__name__)
 
 AUTH_DB_PATH = os.getenv("AUTH_DB_PATH", "./data/auth.db")
 SESSION_TTL_MINUTES = int(os.getenv("SESSION_TTL_MINUTES", "120"))
 SESSION_IDLE_TIMEOUT_MINUTES = int(os.getenv("SESSION_IDLE_TIMEOUT_MINUTES", "30"))
 AUTH_SECRET = os.getenv("AUTH_SECRET", os.getenv("SECRET_KEY", "dev-secret"))
 
-_PASSWORD_HASHER = PasswordHasher()
+ARGON2_TIME_COST = int(os.getenv("ARGON2_TIME_COST", "3"))
+ARGON2_MEMORY_COST_KIB = int(os.getenv("ARGON2_MEMORY_COST_KIB", "65536"))
+ARGON2_PARALLELISM = int(os.getenv("ARGON2_PARALLELISM", "2"))
+
+_PASSWORD_HASHER = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST_KIB,
+    parallelism=ARGON2_PARALLELISM,
+    hash_len=32,
+    salt_len=16,
+)
+_SESSION_SERIALIZER = URLSafeSerializer(AUTH_SECRET, salt="itsg33-session")
+
+# Argon2 releases the GIL while hashing, so the async wrappers below run
+# hashing work here, in parallel and off the event loop
+_PASSWORD_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="password-hash"
+)
+
+_T = TypeVar("_T")
+
+
+# One long-lived connection per thread; opened and tuned on first use
+_local = threading.local()
+
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
 
 
 def _connect() -> sqlite3.Connection:
-    Path(AUTH_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(AUTH_DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Return this thread's auth DB connection.
+
+    Callers use it as a context manager (``with _connect() as conn``) so each
+    helper commits on success and rolls back on error; the connection itself
+    stays open for reuse.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        Path(AUTH_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(AUTH_DB_PATH, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        _local.conn = conn
     return conn
 
 
-def _now() -> str:
-    return datetime.utcnow().isoformat()
+# Hot-path statements, kept as constants so every call hits the connection's
+# prepared-statement cache with the same SQL text
+_INSERT_SESSION_SQL = (
+    "INSERT INTO sessions (id, user_id, created_at, expires_at, last_seen, ip, user_agent) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_TOUCH_SESSION_SQL = """
+    UPDATE sessions SET last_seen = ?
+    WHERE id = ? AND expires_at >= ? AND last_seen >= ?
+    RETURNING *
+"""
+_INSERT_AUDIT_SQL = (
+    "INSERT INTO audit_log (id, user_id, action, target, created_at, metadata) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
 
 
-def _serializer() -> URLSafeSerializer:
-    return URLSafeSerializer(AUTH_SECRET, salt="itsg33-session")
+def _now() -> str:
+    return datetime.utcnow().isoformat()
 
 
 def init_auth_db() -> None:
     """Initialize the auth database and seed roles."""
-    conn = _connect()
-    try:
+    with _connect() as conn:
         cur = conn.cursor()
         cur.execute(
             """
@@ -112,10 +180,12 @@ def init_auth_db() -> None:
             )
             """
         )
-        conn.commit()
+        # Lookups by user; user_roles is already covered by its (user_id, role_id) key
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_sessions_user ON sessions(user_id)")
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_access_user ON assessment_access(user_id)"
+        )
         _seed_roles(conn)
-    finally:
-        conn.close()
 
 
 def _seed_roles(conn: sqlite3.Connection) -> None:
@@ -123,19 +193,95 @@ def _seed_roles(conn: sqlite3.Connection) -> None:
     cur = conn.cursor()
     for role in roles:
         cur.execute("INSERT OR IGNORE INTO roles (name) VALUES (?)", (role,))
-    conn.commit()
+    _load_role_ids(conn)
+
+
+# Role name -> id; the roles table is only written by _seed_roles
+_ROLE_IDS: Dict[str, int] = {}
+
+
+def _load_role_ids(conn: sqlite3.Connection) -> None:
+    cur = conn.execute("SELECT name, id FROM roles")
+    _ROLE_IDS.update({row["name"]: row["id"] for row in cur.fetchall()})
+
+
+def _user_role_pairs(
+    conn: sqlite3.Connection, user_id: str, roles: List[str]
+) -> List[Tuple[str, int]]:
+    if not _ROLE_IDS:
+        _load_role_ids(conn)
+    return [(user_id, _ROLE_IDS[role]) for role in roles if role in _ROLE_IDS]
 
 
 def hash_password(password: str) -> str:
     return _PASSWORD_HASHER.hash(password)
 
 
-def verify_password(hash_value: str, password: str) -> bool:
+# Short-lived record of recent successful verifications, so repeated logins in a
+# burst skip Argon2. Entries are keyed by an HMAC (per-process random key) of the
+# stored hash and candidate password; plaintext passwords are never kept.
+_VERIFY_CACHE_TTL_SECONDS = 60.0
+_VERIFY_CACHE_MAX_ENTRIES = 1024
+_VERIFY_CACHE_KEY = secrets.token_bytes(32)
+_verify_cache: "OrderedDict[bytes, float]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+
+
+def _verify_cache_key(hash_value: str, password: str) -> bytes:
+    message = f"{hash_value}\0{password}".encode()
+    return hmac.new(_VERIFY_CACHE_KEY, message, hashlib.sha256).digest()
+
+
+def measure_password_hash_seconds() -> float:
+    """Time one hash with the configured Argon2 parameters (startup self-test)."""
+    started = time.perf_counter()
+    _PASSWORD_HASHER.hash(secrets.token_urlsafe(16))
+    return time.perf_counter() - started
+
+
+def verify_password(hash_value: str, password: str, user_id: Optional[str] = None) -> bool:
+    """Check a password against its stored hash.
+
+    When ``user_id`` is given and the stored hash was made with different
+    Argon2 parameters than the current ones, it is re-hashed and saved.
+    """
+    key = _verify_cache_key(hash_value, password)
+    now = time.monotonic()
+    with _verify_cache_lock:
+        verified_at = _verify_cache.get(key)
+        if verified_at is not None and now - verified_at < _VERIFY_CACHE_TTL_SECONDS:
+            return True
+
     try:
-        return _PASSWORD_HASHER.verify(hash_value, password)
+        verified = _PASSWORD_HASHER.verify(hash_value, password)
     except VerifyMismatchError:
         return False
 
+    if user_id is not None and _PASSWORD_HASHER.check_needs_rehash(hash_value):
+        _update_password_hash(user_id, hash_password(password))
+
+    with _verify_cache_lock:
+        _verify_cache[key] = now
+        _verify_cache.move_to_end(key)
+        while len(_verify_cache) > _VERIFY_CACHE_MAX_ENTRIES:
+            _verify_cache.popitem(last=False)
+    return verified
+
+
+async def _run_in_password_pool(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PASSWORD_POOL, functools.partial(func, *args, **kwargs))
+
+
+async def measure_password_hash_seconds_async() -> float:
+    return await _run_in_password_pool(measure_password_hash_seconds)
+
+
+async def verify_password_async(
+    hash_value: str, password: str, user_id: Optional[str] = None
+) -> bool:
+    return await _run_in_password_pool(verify_password, hash_value, password, user_id=user_id)
+
 
 def _password_valid(password: str) -> bool:
     if len(password) < 12:
@@ -144,32 +290,42 @@ def _password_valid(password: str) -> bool:
     return password.lower() not in common
 
 
+def _insert_user(
+    conn: sqlite3.Connection, email: str, password_hash: str, roles: List[str]
+) -> str:
+    user_id = uuid.uuid4().hex
+    cur = conn.cursor()
+    cur.execute(
+        "INSERT INTO users (id, email, password_hash, status, created_at, force_password_reset) VALUES (?, ?, ?, ?, ?, ?)",
+        (user_id, email.lower(), password_hash, "active", _now(), 0),
+    )
+    cur.executemany(
+        "INSERT OR IGNORE INTO user_roles (user_id, role_id) VALUES (?, ?)",
+        _user_role_pairs(conn, user_id, roles),
+    )
+    return user_id
+
+
 def create_user(email: str, password: str, roles: List[str]) -> Dict[str, Any]:
     if not _password_valid(password):
         raise ValueError("Password does not meet policy")
-    conn = _connect()
-    try:
-        user_id = str(uuid.uuid4())
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO users (id, email, password_hash, status, created_at, force_password_reset) VALUES (?, ?, ?, ?, ?, ?)",
-            (user_id, email.lower(), hash_password(password), "active", _now(), 0),
-        )
-        for role in roles:
-            cur.execute("SELECT id FROM roles WHERE name = ?", (role,))
-            role_row = cur.fetchone()
-            if role_row:
-                cur.execute(
-                    "INSERT OR IGNORE INTO user_roles (user_id, role_id) VALUES (?, ?)",
-                    (user_id, role_row["id"]),
-                )
-        conn.commit()
-        user = get_user_by_id(user_id)
-        if user is None:
-            raise ValueError("Failed to create user")
-        return user
-    finally:
-        conn.close()
+    # Hash before taking the write lock; Argon2 is the slow part
+    password_hash = hash_password(password)
+    with _connect() as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        user_id = _insert_user(conn, email, password_hash, roles)
+    user = get_user_by_id(user_id)
+    if user is None:
+        raise ValueError("Failed to create user")
+    return user
+
+
+async def create_user_async(email: str, password: str, roles: List[str]) -> Dict[str, Any]:
+    return await _run_in_password_pool(create_user, email, password, roles)
+
+
+def _count_users(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) AS cnt FROM users").fetchone()["cnt"]
 
 
 def bootstrap_admin() -> None:
@@ -177,97 +333,83 @@ def bootstrap_admin() -> None:
     password = os.getenv("INITIAL_ADMIN_PASSWORD")
     if not email or not password:
         return
-    conn = _connect()
-    try:
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(*) AS cnt FROM users")
-        row = cur.fetchone()
-        if row and row["cnt"] > 0:
+    with _connect() as conn:
+        if _count_users(conn) > 0:
             return
-    finally:
-        conn.close()
-
-    try:
-        create_user(email, password, ["admin"])
-    except ValueError:
+    if not _password_valid(password):
         return
 
+    password_hash = hash_password(password)
+    with _connect() as conn:
+        # Re-check under the write lock so concurrent workers create one admin
+        conn.execute("BEGIN IMMEDIATE")
+        if _count_users(conn) == 0:
+            _insert_user(conn, email, password_hash, ["admin"])
+
+
+# Users with their role names folded into one comma-separated column
+_USER_WITH_ROLES_SQL = """
+    SELECT u.*, GROUP_CONCAT(r.name) AS roles
+    FROM users u
+    LEFT JOIN user_roles ur ON ur.user_id = u.id
+    LEFT JOIN roles r ON r.id = ur.role_id
+"""
+
+
+def _user_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    user = dict(row)
+    user["roles"] = user["roles"].split(",") if user["roles"] else []
+    return user
+
 
 def get_user_by_email(email: str) -> Optional[Dict[str, Any]]:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         cur = conn.cursor()
-        cur.execute("SELECT * FROM users WHERE email = ?", (email.lower(),))
+        cur.execute(
+            _USER_WITH_ROLES_SQL + " WHERE u.email = ? GROUP BY u.id", (email.lower(),)
+        )
         row = cur.fetchone()
-        if not row:
-            return None
-        user = dict(row)
-        user["roles"] = get_user_roles(user["id"], conn)
-        return user
-    finally:
-        conn.close()
+        return _user_from_row(row) if row else None
 
 
 def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         cur = conn.cursor()
-        cur.execute("SELECT * FROM users WHERE id = ?", (user_id,))
+        cur.execute(_USER_WITH_ROLES_SQL + " WHERE u.id = ? GROUP BY u.id", (user_id,))
         row = cur.fetchone()
-        if not row:
-            return None
-        user = dict(row)
-        user["roles"] = get_user_roles(user_id, conn)
-        return user
-    finally:
-        conn.close()
+        return _user_from_row(row) if row else None
 
 
 def list_users() -> List[Dict[str, Any]]:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         cur = conn.cursor()
-        cur.execute("SELECT * FROM users")
-        users = []
-        for row in cur.fetchall():
-            user = dict(row)
-            user["roles"] = get_user_roles(user["id"], conn)
-            users.append(user)
-        return users
-    finally:
-        conn.close()
+        cur.execute(_USER_WITH_ROLES_SQL + " GROUP BY u.id")
+        return [_user_from_row(row) for row in cur.fetchall()]
 
 
 def get_user_roles(user_id: str, conn: Optional[sqlite3.Connection] = None) -> List[str]:
-    close_conn = False
     if conn is None:
         conn = _connect()
-        close_conn = True
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT r.name FROM roles r
-            JOIN user_roles ur ON ur.role_id = r.id
-            WHERE ur.user_id = ?
-            """,
-            (user_id,),
-        )
-        return [row["name"] for row in cur.fetchall()]
-    finally:
-        if close_conn:
-            conn.close()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT r.name FROM roles r
+        JOIN user_roles ur ON ur.role_id = r.id
+        WHERE ur.user_id = ?
+        """,
+        (user_id,),
+    )
+    return [row["name"] for row in cur.fetchall()]
 
 
 def create_session(user_id: str, ip: Optional[str], user_agent: Optional[str]) -> str:
-    session_id = str(uuid.uuid4())
+    session_id = uuid.uuid4().hex
     now = datetime.utcnow()
     expires_at = now + timedelta(minutes=SESSION_TTL_MINUTES)
-    conn = _connect()
-    try:
+    with _connect() as conn:
         cur = conn.cursor()
         cur.execute(
-            "INSERT INTO sessions (id, user_id, created_at, expires_at, last_seen, ip, user_agent) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _INSERT_SESSION_SQL,
             (
                 session_id,
                 user_id,
@@ -278,159 +420,207 @@ def create_session(user_id: str, ip: Optional[str], user_agent: Optional[str]) -
                 user_agent,
             ),
         )
-        conn.commit()
-    finally:
-        conn.close()
     return session_id
 
 
 def delete_session(session_id: str) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def validate_session(session_id: str) -> Optional[Dict[str, Any]]:
-    conn = _connect()
-    try:
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
+    now = datetime.utcnow()
+    now_iso = now.isoformat()
+    idle_cutoff = (now - timedelta(minutes=SESSION_IDLE_TIMEOUT_MINUTES)).isoformat()
+    with _connect() as conn:
+        # Check expiry/idle and touch last_seen in one statement; timestamps are
+        # all written by isoformat(), so string comparison orders them correctly
+        cur = conn.execute(
+            _TOUCH_SESSION_SQL,
+            (now_iso, session_id, now_iso, idle_cutoff),
+        )
         row = cur.fetchone()
-        if not row:
-            return None
-
-        session = dict(row)
-        now = datetime.utcnow()
-        expires_at = datetime.fromisoformat(session["expires_at"])
-        last_seen = datetime.fromisoformat(session["last_seen"])
-
-        if now > expires_at:
-            delete_session(session_id)
-            return None
+        if row:
+            return dict(row)
 
-        if (now - last_seen).total_seconds() > SESSION_IDLE_TIMEOUT_MINUTES * 60:
-            delete_session(session_id)
-            return None
-
-        cur.execute("UPDATE sessions SET last_seen = ? WHERE id = ?", (now.isoformat(), session_id))
-        conn.commit()
-        return session
-    finally:
-        conn.close()
+        # Missing, expired or idle: reap it if it is still around
+        conn.execute(
+            "DELETE FROM sessions WHERE id = ? AND (expires_at < ? OR last_seen < ?)",
+            (session_id, now_iso, idle_cutoff),
+        )
+        return None
 
 
 def sign_session_id(session_id: str) -> str:
-    return _serializer().dumps(session_id)
+    return _SESSION_SERIALIZER.dumps(session_id)
 
 
 def unsign_session_id(value: str) -> Optional[str]:
     try:
-        return _serializer().loads(value)
+        return _SESSION_SERIALIZER.loads(value)
     except BadSignature:
         return None
 
 
+# Audit rows are queued and written in batches by a background thread, so a
+# request only pays for a queue put rather than its own commit
+_AUDIT_BATCH_SIZE = 500
+_AUDIT_FLUSH_INTERVAL_SECONDS = 0.25
+_AUDIT_WRITE_ATTEMPTS = 3
+_AUDIT_RETRY_DELAY_SECONDS = 0.1
+_audit_queue: "queue.Queue[Tuple[Any, ...]]" = queue.Queue()
+_audit_writer_lock = threading.Lock()
+_audit_writer: Optional[threading.Thread] = None
+
+
+def _take_audit_batch(timeout: Optional[float]) -> List[Tuple[Any, ...]]:
+    """Take up to one batch of queued rows, waiting ``timeout`` seconds for the
+    first one (or not at all when ``timeout`` is None)."""
+    try:
+        rows = [_audit_queue.get(timeout=timeout) if timeout else _audit_queue.get_nowait()]
+    except queue.Empty:
+        return []
+    while len(rows) < _AUDIT_BATCH_SIZE:
+        try:
+            rows.append(_audit_queue.get_nowait())
+        except queue.Empty:
+            break
+    return rows
+
+
+def _write_audit_batch(rows: List[Tuple[Any, ...]]) -> None:
+    """Insert a batch of audit rows, retrying transient SQLite errors.
+
+    Rows live only in memory until written, so a batch that still fails
+    after the last attempt is lost; that is logged at error level with
+    the number of rows dropped.
+    """
+    try:
+        for attempt in range(1, _AUDIT_WRITE_ATTEMPTS + 1):
+            try:
+                with _connect() as conn:
+                    conn.executemany(_INSERT_AUDIT_SQL, rows)
+                return
+            except sqlite3.Error:
+                if attempt == _AUDIT_WRITE_ATTEMPTS:
+                    logger.exception(
+                        "Audit log write failed after %d attempts; %d rows dropped",
+                        attempt,
+                        len(rows),
+                    )
+                    return
+                time.sleep(_AUDIT_RETRY_DELAY_SECONDS * attempt)
+    finally:
+        for _ in rows:
+            _audit_queue.task_done()
+
+
+def _audit_writer_loop() -> None:
+    while True:
+        rows = _take_audit_batch(_AUDIT_FLUSH_INTERVAL_SECONDS)
+        if rows:
+            _write_audit_batch(rows)
+
+
+def _ensure_audit_writer() -> None:
+    global _audit_writer
+    if _audit_writer is not None:
+        return
+    with _audit_writer_lock:
+        if _audit_writer is None:
+            _audit_writer = threading.Thread(
+                target=_audit_writer_loop, name="audit-log-writer", daemon=True
+            )
+            _audit_writer.start()
+
+
+def flush_audit_log() -> None:
+    """Write any queued audit rows and wait for in-flight batches to land."""
+    while rows := _take_audit_batch(None):
+        _write_audit_batch(rows)
+    _audit_queue.join()
+
+
+atexit.register(flush_audit_log)
+
+
 def log_audit(
     user_id: Optional[str], action: str, target: Optional[str], metadata: Dict[str, Any]
 ) -> None:
-    conn = _connect()
-    try:
-        conn.execute(
-            "INSERT INTO audit_log (id, user_id, action, target, created_at, metadata) VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                str(uuid.uuid4()),
-                user_id,
-                action,
-                target,
-                _now(),
-                json.dumps(metadata),
-            ),
+    _ensure_audit_writer()
+    _audit_queue.put(
+        (
+            secrets.token_hex(16),
+            user_id,
+            action,
+            target,
+            _now(),
+            json.dumps(metadata),
         )
-        conn.commit()
-    finally:
-        conn.close()
+    )
 
 
 def set_user_password(user_id: str, new_password: str, force_reset: bool = False) -> None:
     if not _password_valid(new_password):
         raise ValueError("Password does not meet policy")
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute(
             "UPDATE users SET password_hash = ?, force_password_reset = ? WHERE id = ?",
             (hash_password(new_password), 1 if force_reset else 0, user_id),
         )
-        conn.commit()
-    finally:
-        conn.close()
+
+
+async def set_user_password_async(
+    user_id: str, new_password: str, force_reset: bool = False
+) -> None:
+    await _run_in_password_pool(set_user_password, user_id, new_password, force_reset)
+
+
+def _update_password_hash(user_id: str, password_hash: str) -> None:
+    with _connect() as conn:
+        conn.execute("UPDATE users SET password_hash = ? WHERE id = ?", (password_hash, user_id))
 
 
 def set_user_force_reset(user_id: str, value: bool) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute(
             "UPDATE users SET force_password_reset = ? WHERE id = ?",
             (1 if value else 0, user_id),
         )
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def set_user_roles(user_id: str, roles: List[str]) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
+        conn.execute("BEGIN IMMEDIATE")
         cur = conn.cursor()
         cur.execute("DELETE FROM user_roles WHERE user_id = ?", (user_id,))
-        for role in roles:
-            cur.execute("SELECT id FROM roles WHERE name = ?", (role,))
-            role_row = cur.fetchone()
-            if role_row:
-                cur.execute(
-                    "INSERT OR IGNORE INTO user_roles (user_id, role_id) VALUES (?, ?)",
-                    (user_id, role_row["id"]),
-                )
-        conn.commit()
-    finally:
-        conn.close()
+        cur.executemany(
+            "INSERT OR IGNORE INTO user_roles (user_id, role_id) VALUES (?, ?)",
+            _user_role_pairs(conn, user_id, roles),
+        )
 
 
 def set_user_status(user_id: str, status: str) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute("UPDATE users SET status = ? WHERE id = ?", (status, user_id))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def delete_user_sessions(user_id: str) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def delete_user(user_id: str) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute("DELETE FROM sessions WHERE user_id = ?", (user_id,))
         conn.execute("DELETE FROM user_roles WHERE user_id = ?", (user_id,))
         conn.execute("DELETE FROM assessment_access WHERE user_id = ?", (user_id,))
         conn.execute("DELETE FROM users WHERE id = ?", (user_id,))
-        conn.commit()
-    finally:
-        conn.close()
+    _invalidate_share_cache()
 
 
 def count_active_admins() -> int:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         cur = conn.cursor()
         cur.execute(
             """
@@ -443,54 +633,67 @@ def count_active_admins() -> int:
         )
         row = cur.fetchone()
         return int(row["cnt"]) if row else 0
-    finally:
-        conn.close()
 
 
 def update_last_login(user_id: str) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute("UPDATE users SET last_login = ? WHERE id = ?", (_now(), user_id))
-        conn.commit()
-    finally:
-        conn.close()
+
+
+# Per-user shared assessment ids. Writes in this process bump the version;
+# the TTL bounds staleness when another process changes the table.
+_SHARE_CACHE_TTL_SECONDS = 60.0
+_share_version = 0
+_share_cache: Dict[str, Tuple[int, float, List[str]]] = {}
+_share_cache_lock = threading.Lock()
+
+
+def _invalidate_share_cache() -> None:
+    global _share_version
+    with _share_cache_lock:
+        _share_version += 1
+        _share_cache.clear()
 
 
 def share_assessment(assessment_id: str, user_id: str, role_scope: str) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute(
             "INSERT OR REPLACE INTO assessment_access (assessment_id, user_id, role_scope, created_at) VALUES (?, ?, ?, ?)",
             (assessment_id, user_id, role_scope, _now()),
         )
-        conn.commit()
-    finally:
-        conn.close()
+    _invalidate_share_cache()
 
 
 def unshare_assessment(assessment_id: str, user_id: str) -> None:
-    conn = _connect()
-    try:
+    with _connect() as conn:
         conn.execute(
             "DELETE FROM assessment_access WHERE assessment_id = ? AND user_id = ?",
             (assessment_id, user_id),
         )
-        conn.commit()
-    finally:
-        conn.close()
+    _invalidate_share_cache()
 
 
 def get_shared_assessment_ids(user_id: str) -> List[str]:
-    conn = _connect()
-    try:
+    now = time.monotonic()
+    with _share_cache_lock:
+        version = _share_version
+        cached = _share_cache.get(user_id)
+    if cached is not None and cached[0] == version and now - cached[1] < _SHARE_CACHE_TTL_SECONDS:
+        return list(cached[2])
+
+    with _connect() as conn:
         cur = conn.cursor()
         cur.execute(
             "SELECT assessment_id FROM assessment_access WHERE user_id = ?",
             (user_id,),
         )
-        return [row["assessment_id"] for row in cur.fetchall()]
-    finally:
-        conn.close()
+        ids = [row["assessment_id"] for row in cur.fetchall()]
+
+    with _share_cache_lock:
+        # Skip the store if a share/unshare landed while we were querying
+        if version == _share_version:
+            _share_cache[user_id] = (version, now, ids)
+    return list(ids)
 
 
 def user_has_role(user: Dict[str, Any], roles: List[str]) -> bool:
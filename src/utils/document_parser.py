@@ -1,273 +1,461 @@
 """Document parser for various file formats."""
 
+import asyncio
+import multiprocessing
 import os
+import posixpath
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+from itertools import islice
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 import aiofiles
-from pypdf import PdfReader
+from isal import igzip
+import pypdfium2 as pdfium
 from docx import Document
+from docx.enum.style import WD_STYLE_TYPE
+from docx.oxml.ns import qn
 from PIL import Image
 import io
 import cv2
 import tempfile
 import zipfile
 import tarfile
-import shutil
-from typing import Optional, Dict, Any, List, Union
+from typing import AbstractSet, Callable, IO, Optional, Dict, Any, Iterator, List, Tuple, Union
+
+LOG_TAIL_BYTES = 512 * 1024
+KEYFRAME_INTERVAL_MS = 10_000
+W_P = qn("w:p")
+W_R = qn("w:r")
+W_T = qn("w:t")
+W_BR = qn("w:br")
+W_TYPE = qn("w:type")
+# Run children rendered as fixed characters, matching python-docx's run.text
+_W_RUN_CHARS = {
+    qn("w:tab"): "\t",
+    qn("w:ptab"): "\t",
+    qn("w:cr"): "\n",
+    qn("w:noBreakHyphen"): "-",
+}
+PDF_PARALLEL_MIN_PAGES = 8
+ARCHIVE_MAX_MEMBER_BYTES = 1 * 1024 * 1024
+PDF_MAX_WORKERS = min(os.cpu_count() or 1, 4)
+
+# pdfium is not thread-safe; in-process calls made from worker threads
+# must hold this lock
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _read_log_head_and_tail(file_path: Path, file_size: int, num_lines: int) -> Tuple[str, str]:
+    """Read the first ``num_lines`` lines and the last 512KB of a log file.
+
+    The middle of the file is never read or decoded.
+    """
+    with open(file_path, "rb") as f:
+        head = b"".join(islice(f, num_lines))
+        tail = os.pread(f.fileno(), LOG_TAIL_BYTES, max(0, file_size - LOG_TAIL_BYTES))
+    return (
+        head.decode("utf-8", errors="ignore"),
+        tail.decode("utf-8", errors="ignore"),
+    )
+
+
+def _iter_archive_members(
+    file_path: Path,
+) -> Iterator[Tuple[str, int, Callable[[], IO[bytes]]]]:
+    """Yield ``(name, size, open_member)`` for each regular file in a zip or tar.
+
+    Members are streamed from the archive itself; nothing is written to disk.
+    Tar members are yielded in stream order, so compressed tars are read in a
+    single forward pass.
+    """
+    if file_path.suffix.lower() == ".zip":
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            for info in zip_ref.infolist():
+                if not info.is_dir():
+                    yield info.filename, info.file_size, partial(zip_ref.open, info)
+    elif file_path.suffix.lower() in {".tar", ".gz"}:
+        with ExitStack() as stack:
+            if file_path.suffix.lower() == ".gz" or file_path.name.endswith(".tar.gz"):
+                # ISA-L inflates gzip roughly twice as fast as zlib; members
+                # are consumed in order, so a forward-only stream is enough
+                gz = stack.enter_context(igzip.open(file_path, "rb"))
+                tar_ref = stack.enter_context(tarfile.open(fileobj=gz, mode="r|"))
+            else:
+                tar_ref = stack.enter_context(tarfile.open(file_path, "r:"))
+            for member in tar_ref:
+                if member.isfile():
+                    yield member.name, member.size, partial(tar_ref.extractfile, member)
+
+
+def _decode_archive_entry(raw: bytes, keywords: AbstractSet[str]) -> Optional[Tuple[str, bool]]:
+    """Decode an archive member and check it for security keywords.
+
+    Returns None for blank files.
+    """
+    content = raw.decode("utf-8", errors="ignore")
+    if not content.strip():
+        return None
+
+    # Balanced security keyword check. Lowercase once: calling lower() inside
+    # the generator copied the whole file again for every keyword tried
+    lowered = content.lower()
+    return content, any(kw in lowered for kw in keywords)
+
+
+def _pdf_page_texts(pdf: pdfium.PdfDocument, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of pages ``start``..``stop``, releasing page handles as we go."""
+    for i in range(start, len(pdf) if stop is None else stop):
+        page = pdf[i]
+        textpage = page.get_textpage()
+        try:
+            yield textpage.get_text_range()
+        finally:
+            textpage.close()
+            page.close()
+
+
+def _extract_pdf_pages(path: str, start: int, stop: int) -> List[str]:
+    """Extract a run of page texts in a worker process."""
+    pdf = pdfium.PdfDocument(path)
+    try:
+        return list(_pdf_page_texts(pdf, start, stop))
+    finally:
+        pdf.close()
+
+
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    global _pdf_pool
+    if _pdf_pool is None:
+        # spawn, not fork: the server process has threads and pdfium state
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=PDF_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_pool
+
+
+def _read_pdf_inline(path: str) -> Tuple[Optional[List[str]], Dict[str, str], int]:
+    """Open a PDF and return ``(page_texts, metadata, page_count)``.
+
+    Page texts are only extracted for documents shorter than
+    ``PDF_PARALLEL_MIN_PAGES``; for longer ones they are None.
+    """
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(path)
+        try:
+            metadata = pdf.get_metadata_dict(skip_empty=True)
+            page_count = len(pdf)
+            texts = list(_pdf_page_texts(pdf)) if page_count < PDF_PARALLEL_MIN_PAGES else None
+            return texts, metadata, page_count
+        finally:
+            pdf.close()
+
+
+async def _read_pdf(file_path: Path) -> Tuple[List[str], Dict[str, str]]:
+    """Return the page texts and metadata of a PDF.
+
+    Short documents are read in a worker thread; longer ones are split into
+    contiguous page runs extracted in parallel by a shared process pool.
+    """
+    texts, metadata, page_count = await asyncio.to_thread(_read_pdf_inline, str(file_path))
+    if texts is not None:
+        return texts, metadata
+
+    step = -(-page_count // PDF_MAX_WORKERS)
+    loop = asyncio.get_running_loop()
+    pool = _get_pdf_pool()
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                pool, _extract_pdf_pages, str(file_path), start, min(start + step, page_count)
+            )
+            for start in range(0, page_count, step)
+        )
+    )
+    return [text for chunk in chunks for text in chunk], metadata
+
+
+def _paragraph_text(p: Any) -> str:
+    """Return the text of a ``w:p`` element the way ``paragraph.text`` does.
+
+    Tabs become ``\t`` and line breaks ``\n``; page and column breaks add
+    nothing.
+    """
+    parts = []
+    for el in p.iter(W_T, W_BR, *_W_RUN_CHARS):
+        tag = el.tag
+        if tag == W_T:
+            if el.text:
+                parts.append(el.text)
+        elif el.getparent().tag != W_R:
+            # Tab stops under w:pPr/w:tabs are formatting, not content
+            continue
+        elif tag == W_BR:
+            if el.get(W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_W_RUN_CHARS[tag])
+    return "".join(parts)
+
+
+async def _write_bytes(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` without blocking the event loop."""
+    async with aiofiles.open(path, "wb") as f:
+        await f.write(data)
 
 
 class DocumentParser:
     """Parser for various document formats."""
 
-    SUPPORTED_EXTENSIONS = {
-        ".pdf",
-        ".docx",
-        ".doc",
-        ".txt",
-        ".md",
-        ".log",
-        ".png",
-        ".jpg",
-        ".jpeg",
-        ".mp4",
-        ".mov",
-        ".avi",
-        ".zip",
-        ".tar",
-        ".gz",
-    }
-
-    SECURITY_KEYWORDS = {
-        "iam",
-        "policy",
-        "auth",
-        "encrypt",
-        "secret",
-        "access",
-        "role",
-        "allow",
-        "deny",
-        "ingress",
-        "egress",
-        "mfa",
-        "tls",
-        "ssl",
-        "vault",
-        "rbac",
-        "kms",
-        "security_group",
-        "firewall",
-        "authorization",
-        "authentication",
-    }
+    SUPPORTED_EXTENSIONS = frozenset(
+        {
+            ".pdf",
+            ".docx",
+            ".doc",
+            ".txt",
+            ".md",
+            ".log",
+            ".png",
+            ".jpg",
+            ".jpeg",
+            ".mp4",
+            ".mov",
+            ".avi",
+            ".zip",
+            ".tar",
+            ".gz",
+        }
+    )
+    _SUPPORTED_EXTENSIONS_SORTED = tuple(sorted(SUPPORTED_EXTENSIONS))
+
+    SECURITY_KEYWORDS = frozenset(
+        {
+            "iam",
+            "policy",
+            "auth",
+            "encrypt",
+            "secret",
+            "access",
+            "role",
+            "allow",
+            "deny",
+            "ingress",
+            "egress",
+            "mfa",
+            "tls",
+            "ssl",
+            "vault",
+            "rbac",
+            "kms",
+            "security_group",
+            "firewall",
+            "authorization",
+            "authentication",
+        }
+    )
+
+    # Archive members under these directories or with these extensions are
+    # never read
+    _ARCHIVE_IGNORE_DIRS = frozenset(
+        {
+            ".git",
+            ".terraform",
+            "node_modules",
+            "venv",
+            "__pycache__",
+            "obj",
+            "bin",
+            "dist",
+        }
+    )
+    _ARCHIVE_IGNORE_EXTS = frozenset(
+        {
+            ".exe",
+            ".dll",
+            ".so",
+            ".pyc",
+            ".png",
+            ".jpg",
+            ".jpeg",
+            ".gif",
+            ".pdf",
+            ".docx",
+            ".zip",
+            ".tar",
+            ".gz",
+        }
+    )
+
+    _IAC_EXTS = frozenset({".tf", ".tfvars", ".yaml", ".yml", ".json"})
+    _IAC_NAMES = frozenset({"dockerfile", "chart.yaml", "values.yaml", "kustomization.yaml"})
+    _CODE_EXTS = frozenset(
+        {".py", ".js", ".ts", ".go", ".java", ".cs", ".rb", ".php", ".c", ".cpp", ".h"}
+    )
 
     def __init__(self, upload_dir: str = "./uploads"):
         """Initialize document parser."""
         self.upload_dir = Path(upload_dir)
         self.upload_dir.mkdir(parents=True, exist_ok=True)
 
+        parse_text = partial(self._parse_text, doc_type="text")
+        self._dispatch = {
+            ".pdf": self._parse_pdf,
+            ".docx": self._parse_docx,
+            ".doc": self._parse_docx,
+            ".txt": parse_text,
+            ".md": parse_text,
+            ".log": partial(self._parse_text, doc_type="log"),
+            ".png": self._parse_image,
+            ".jpg": self._parse_image,
+            ".jpeg": self._parse_image,
+            ".mp4": self._parse_video,
+            ".mov": self._parse_video,
+            ".avi": self._parse_video,
+            ".zip": self._parse_archive,
+            ".tar": self._parse_archive,
+            ".gz": self._parse_archive,
+        }
+        self._text_dispatch = {
+            ".pdf": self._pdf_text,
+            ".docx": self._docx_text,
+            ".doc": self._docx_text,
+            ".txt": self._plain_text,
+            ".md": self._plain_text,
+        }
+
     async def parse(self, file_path: Path) -> Optional[Union[Dict[str, Any], List[Dict[str, Any]]]]:
         """Parse a document and extract content."""
         if not file_path.exists():
             return None
 
-        extension = file_path.suffix.lower()
-
-        if extension == ".pdf":
-            return await self._parse_pdf(file_path)
-        elif extension in {".docx", ".doc"}:
-            return await self._parse_docx(file_path)
-        elif extension in {".txt", ".md"}:
-            return await self._parse_text(file_path, doc_type="text")
-        elif extension in {".log"}:
-            return await self._parse_text(file_path, doc_type="log")
-        elif extension in {".png", ".jpg", ".jpeg"}:
-            return await self._parse_image(file_path)
-        elif extension in {".mp4", ".mov", ".avi"}:
-            return await self._parse_video(file_path)
-        elif extension in {".zip", ".tar", ".gz"}:
-            return await self._parse_archive(file_path)
-        else:
-            return None
+        handler = self._dispatch.get(file_path.suffix.lower())
+        return await handler(file_path) if handler else None
 
     async def _parse_archive(self, file_path: Path) -> List[Dict[str, Any]]:
         """Extract and parse files from a repository archive."""
-        extracted_files = []
-        temp_extract_dir = Path(tempfile.mkdtemp(prefix="repo_extract_"))
-
-        try:
-            # Extract the archive
-            if file_path.suffix.lower() == ".zip":
-                with zipfile.ZipFile(file_path, "r") as zip_ref:
-                    zip_ref.extractall(temp_extract_dir)
-            elif file_path.suffix.lower() in {".tar", ".gz"}:
-                mode = (
-                    "r:gz"
-                    if file_path.suffix.lower() == ".gz" or file_path.name.endswith(".tar.gz")
-                    else "r:"
-                )
-                with tarfile.open(file_path, mode) as tar_ref:
-                    tar_ref.extractall(temp_extract_dir)
-
-            # Walk through the extracted files
-            ignore_dirs = {
-                ".git",
-                ".terraform",
-                "node_modules",
-                "venv",
-                "__pycache__",
-                "obj",
-                "bin",
-                "dist",
-            }
-            ignore_exts = {
-                ".exe",
-                ".dll",
-                ".so",
-                ".pyc",
-                ".png",
-                ".jpg",
-                ".jpeg",
-                ".gif",
-                ".pdf",
-                ".docx",
-                ".zip",
-                ".tar",
-                ".gz",
+        entries = await asyncio.to_thread(self._read_archive, file_path)
+
+        extracted_files = [
+            {
+                "type": doc_type,
+                "filename": name,
+                "original_archive": file_path.name,
+                "full_text": content,
+                "contains_security_keywords": contains_keywords,
+                "message": f"Extracted from {file_path.name}",
             }
-
-            for root, dirs, files in os.walk(temp_extract_dir):
-                # Filter out ignored directories
-                dirs[:] = [d for d in dirs if d not in ignore_dirs]
-
-                for name in files:
-                    full_path = Path(root) / name
-
-                    # Skip large files > 1MB
-                    if full_path.stat().st_size > 1 * 1024 * 1024:
-                        continue
-
-                    if full_path.suffix.lower() in ignore_exts:
-                        continue
-
-                    # Determine document type (IaC vs Code)
-                    doc_type = self._classify_file(full_path)
-                    if not doc_type:
-                        continue
-
-                    # Read content
-                    try:
-                        async with aiofiles.open(
-                            full_path, "r", encoding="utf-8", errors="ignore"
-                        ) as f:
-                            content = await f.read()
-                    except Exception:
-                        continue
-
-                    if not content.strip():
-                        continue
-
-                    # Balanced security keyword check
-                    contains_keywords = any(kw in content.lower() for kw in self.SECURITY_KEYWORDS)
-
-                    # Store relative path within repo
-                    rel_path = full_path.relative_to(temp_extract_dir)
-
-                    extracted_files.append(
-                        {
-                            "type": doc_type,
-                            "filename": str(rel_path),
-                            "original_archive": file_path.name,
-                            "full_text": content,
-                            "contains_security_keywords": contains_keywords,
-                            "message": f"Extracted from {file_path.name}",
-                        }
-                    )
-
-        finally:
-            # We keep the temp dir for a moment? No, better copy what we need and delete.
-            # But here we return the text content, so we can delete.
-            shutil.rmtree(temp_extract_dir, ignore_errors=True)
+            for name, doc_type, content, contains_keywords in entries
+        ]
 
         # Sort: prioritize files with security keywords
         extracted_files.sort(key=lambda x: x["contains_security_keywords"], reverse=True)
 
         return extracted_files
 
-    def _classify_file(self, file_path: Path) -> Optional[str]:
-        """Classify a file as IaC, Code, or other."""
-        ext = file_path.suffix.lower()
-        name = file_path.name.lower()
-
-        # Infrastructure as Code (Tier 2)
-        iac_exts = {".tf", ".tfvars", ".yaml", ".yml", ".json"}
-        iac_names = {"dockerfile", "chart.yaml", "values.yaml", "kustomization.yaml"}
-
-        if ext in iac_exts or name in iac_names:
-            # Special check for Helm/K8s/Terraform
-            if ext in {".yaml", ".yml", ".json"}:
-                # Only include if security-relevant or part of a known pattern
-                # (Balanced: include if in a 'templates' dir or has keywords)
-                # For now, let's be more inclusive for .tf and known names
-                if ext == ".tf" or name in iac_names:
-                    return "iac"
-
-                # Check for Helm templates or K8s
-                if "templates/" in str(file_path).lower():
-                    return "iac"
-
-                return "iac"  # Return iac anyway, we'll filter by keyword in archive loop if needed
+    def _read_archive(self, file_path: Path) -> List[Tuple[str, str, str, bool]]:
+        """Read the relevant members of an archive in memory.
+
+        Returns ``(name, doc_type, content, contains_keywords)`` per kept member.
+        """
+        entries = []
+        for name, size, open_member in _iter_archive_members(file_path):
+            # Plain string ops: this loop runs once per archive member
+            member_name = posixpath.normpath(name).lstrip("/")
+            dir_name, base_name = posixpath.split(member_name)
+            lower_name = base_name.lower()
+            ext = posixpath.splitext(lower_name)[1]
+
+            if ext in self._ARCHIVE_IGNORE_EXTS:
+                continue
+
+            # Skip files inside ignored directories
+            if dir_name and not self._ARCHIVE_IGNORE_DIRS.isdisjoint(dir_name.split("/")):
+                continue
+
+            # Skip large files > 1MB
+            if size > ARCHIVE_MAX_MEMBER_BYTES:
+                continue
+
+            # Determine document type (IaC vs Code)
+            doc_type = self._classify_name(lower_name, ext)
+            if not doc_type:
+                continue
+
+            try:
+                with open_member() as f:
+                    raw = f.read(ARCHIVE_MAX_MEMBER_BYTES + 1)
+            except Exception:
+                continue
+
+            # Sizes come from archive headers; don't trust them past the cap
+            if len(raw) > ARCHIVE_MAX_MEMBER_BYTES:
+                continue
+
+            result = _decode_archive_entry(raw, self.SECURITY_KEYWORDS)
+            if result is not None:
+                entries.append((member_name, doc_type, *result))
+
+        return entries
+
+    def _classify_name(self, name: str, ext: str) -> Optional[str]:
+        """Classify a lowercased file name with its extension as IaC, Code, or other."""
+        # Infrastructure as Code (Tier 2). YAML/JSON outside Helm templates is
+        # kept too; the archive scan ranks it by security keywords instead
+        if ext in self._IAC_EXTS or name in self._IAC_NAMES:
             return "iac"
 
         # Source Code (Tier 4)
-        code_exts = {".py", ".js", ".ts", ".go", ".java", ".cs", ".rb", ".php", ".c", ".cpp", ".h"}
-        if ext in code_exts:
+        if ext in self._CODE_EXTS:
             return "code"
 
         return None
 
     async def _parse_pdf(self, file_path: Path) -> Dict[str, Any]:
         """Parse PDF document."""
-        reader = PdfReader(str(file_path))
-
-        pages = []
-        full_text = []
-
-        for i, page in enumerate(reader.pages):
-            text = page.extract_text() or ""
-            pages.append({"page_number": i + 1, "text": text, "char_count": len(text)})
-            full_text.append(text)
+        texts, metadata = await _read_pdf(file_path)
 
         return {
             "type": "pdf",
             "filename": file_path.name,
-            "page_count": len(reader.pages),
-            "pages": pages,
-            "full_text": "\n\n".join(full_text),
-            "metadata": reader.metadata or {},
+            "page_count": len(texts),
+            "pages": [
+                {"page_number": i, "text": text, "char_count": len(text)}
+                for i, text in enumerate(texts, start=1)
+            ],
+            "full_text": "\n\n".join(texts),
+            "metadata": metadata,
         }
 
     async def _parse_docx(self, file_path: Path) -> Dict[str, Any]:
         """Parse Word document."""
+        return await asyncio.to_thread(self._sync_parse_docx, file_path)
+
+    def _sync_parse_docx(self, file_path: Path) -> Dict[str, Any]:
+        """Parse a Word document synchronously; run off the event loop."""
         doc = Document(str(file_path))
 
-        paragraphs = []
-        tables = []
+        # Resolve paragraph styles from the raw style ids; para.style re-queries
+        # the styles part on every access
+        style_names = {style.style_id: style.name for style in doc.styles}
+        default_style = doc.styles.default(WD_STYLE_TYPE.PARAGRAPH)
+        default_style_name = default_style.name if default_style is not None else None
 
-        for para in doc.paragraphs:
-            if para.text.strip():
-                paragraphs.append(
-                    {"text": para.text, "style": para.style.name if para.style else None}
-                )
+        paragraphs = []
+        texts = []
 
-        for table in doc.tables:
-            table_data = []
-            for row in table.rows:
-                row_data = [cell.text for cell in row.cells]
-                table_data.append(row_data)
-            tables.append(table_data)
+        for p in doc.element.body.iterchildren(W_P):
+            text = _paragraph_text(p)
+            if not text.strip():
+                continue
+            paragraphs.append({"text": text, "style": style_names.get(p.style, default_style_name)})
+            texts.append(text)
 
-        full_text = "\n".join([p["text"] for p in paragraphs])
+        tables = [[[cell.text for cell in row.cells] for row in table.rows] for table in doc.tables]
 
         return {
             "type": "docx",
@@ -275,7 +463,7 @@ class DocumentParser:
             "paragraph_count": len(paragraphs),
             "paragraphs": paragraphs,
             "tables": tables,
-            "full_text": full_text,
+            "full_text": "\n".join(texts),
         }
 
     async def _parse_text(self, file_path: Path, doc_type: str = "text") -> Dict[str, Any]:
@@ -284,46 +472,28 @@ class DocumentParser:
         max_size = 5 * 1024 * 1024  # 5MB
 
         if file_size > max_size and doc_type == "log":
-            return await self._sample_large_log(file_path)
-
-        async with aiofiles.open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = await f.read()
+            return await self._sample_large_log(file_path, file_size)
 
-        lines = content.split("\n")
+        # One bulk read in a worker thread rather than a thread hop per chunk
+        content = await asyncio.to_thread(file_path.read_text, encoding="utf-8", errors="ignore")
 
         return {
             "type": doc_type,
             "filename": file_path.name,
-            "line_count": len(lines),
+            "line_count": content.count("\n") + 1,
             "char_count": len(content),
             "full_text": content,
         }
 
-    async def _sample_large_log(self, file_path: Path) -> Dict[str, Any]:
+    async def _sample_large_log(self, file_path: Path, file_size: int) -> Dict[str, Any]:
         """Sample the beginning and end of a large log file."""
-        head_lines = []
-        tail_lines = []
         num_lines = 5000
-
-        async with aiofiles.open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            # Read head
-            for _ in range(num_lines):
-                line = await f.readline()
-                if not line:
-                    break
-                head_lines.append(line)
-
-            # Read tail
-            file_size = file_path.stat().st_size
-            # Seek back 512KB to find the last lines
-            await f.seek(max(0, file_size - 1024 * 512))
-            tail_content = await f.read()
-            tail_lines = tail_content.splitlines()[-num_lines:]
+        head, tail = await asyncio.to_thread(_read_log_head_and_tail, file_path, file_size, num_lines)
 
         content = (
-            "".join(head_lines)
+            head
             + "\n\n[... LOG SAMPLED DUE TO SIZE ...]\n\n"
-            + "\n".join(tail_lines)
+            + "\n".join(tail.splitlines()[-num_lines:])
         )
 
         return {
@@ -353,29 +523,31 @@ class DocumentParser:
         frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
         duration = frame_count / fps if fps > 0 else 0
 
-        # Extract a frame every 10 seconds, up to 10 frames
-        interval = max(1, int(fps * 10))
+        # Seek to a frame every 10 seconds, up to 10 frames, instead of decoding
+        # every frame in between
+        num_frames = min(10, int(duration * 1000 // KEYFRAME_INTERVAL_MS) + 1) if duration else 0
+        temp_dir = Path(tempfile.gettempdir()) / "itsg33_keyframes"
+        temp_dir.mkdir(exist_ok=True)
+
         frames = []
+        writes = []
 
-        count = 0
-        while cap.isOpened() and len(frames) < 10:
+        for k in range(num_frames):
+            cap.set(cv2.CAP_PROP_POS_MSEC, k * KEYFRAME_INTERVAL_MS)
             ret, frame = cap.read()
             if not ret:
                 break
 
-            if count % interval == 0:
-                # Save keyframe to a temporary directory
-                temp_dir = Path(tempfile.gettempdir()) / "itsg33_keyframes"
-                temp_dir.mkdir(exist_ok=True)
+            ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, 80])
+            if not ok:
+                continue
 
-                frame_filename = f"{file_path.stem}_frame_{len(frames)}.jpg"
-                frame_path = temp_dir / frame_filename
-                cv2.imwrite(str(frame_path), frame)
-                frames.append({"timestamp": count / fps, "path": str(frame_path)})
-
-            count += 1
+            frame_path = temp_dir / f"{file_path.stem}_frame_{len(frames)}.jpg"
+            writes.append(asyncio.create_task(_write_bytes(frame_path, encoded.tobytes())))
+            frames.append({"timestamp": k * KEYFRAME_INTERVAL_MS / 1000, "path": str(frame_path)})
 
         cap.release()
+        await asyncio.gather(*writes)
 
         return {
             "type": "video",
@@ -386,13 +558,40 @@ class DocumentParser:
             "full_text": f"Video file: {file_path.name}. Duration: {duration:.2f}s. {len(frames)} keyframes extracted for analysis.",
         }
 
-    def get_supported_extensions(self) -> List[str]:
-        """Return list of supported file extensions."""
-        return list(self.SUPPORTED_EXTENSIONS)
+    def get_supported_extensions(self) -> Tuple[str, ...]:
+        """Return the supported file extensions."""
+        return self._SUPPORTED_EXTENSIONS_SORTED
 
     async def extract_text(self, file_path: Path) -> str:
         """Extract plain text from a document."""
+        if not file_path.exists():
+            return ""
+
+        # Formats with a text-only path skip building the full parsed structure
+        fast_path = self._text_dispatch.get(file_path.suffix.lower())
+        if fast_path:
+            return await fast_path(file_path)
+
         parsed = await self.parse(file_path)
-        if parsed and "full_text" in parsed:
+        if isinstance(parsed, dict) and "full_text" in parsed:
             return parsed["full_text"]
         return ""
+
+    async def _pdf_text(self, file_path: Path) -> str:
+        """Return the text of a PDF without per-page bookkeeping."""
+        texts, _ = await _read_pdf(file_path)
+        return "\n\n".join(texts)
+
+    async def _docx_text(self, file_path: Path) -> str:
+        """Return the non-empty paragraph text of a Word document."""
+        return await asyncio.to_thread(self._sync_docx_text, file_path)
+
+    def _sync_docx_text(self, file_path: Path) -> str:
+        """Extract Word document text synchronously; run off the event loop."""
+        doc = Document(str(file_path))
+        texts = (_paragraph_text(p) for p in doc.element.body.iterchildren(W_P))
+        return "\n".join(text for text in texts if text.strip())
+
+    async def _plain_text(self, file_path: Path) -> str:
+        """Return the contents of a text file."""
+        return await asyncio.to_thread(file_path.read_text, encoding="utf-8", errors="ignore")
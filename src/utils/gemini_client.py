@@ -7,6 +7,8 @@ import google.generativeai as genai
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
+# Loaded at import time on purpose: modules such as auth read their
+# settings from the environment when they are imported
 load_dotenv()
 
 
@@ -94,3 +96,14 @@ class GeminiClient:
         """
         response = self.generate(prompt)
         return {"raw_response": response}
+
+
+_default_client: Optional[GeminiClient] = None
+
+
+def get_default_client() -> GeminiClient:
+    """Return the process-wide client built from the environment."""
+    global _default_client
+    if _default_client is None:
+        _default_client = GeminiClient()
+    return _default_client
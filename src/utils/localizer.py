@@ -1,13 +1,54 @@
+import copy
 import json
-from typing import Dict, Any, List
-from src.utils.gemini_client import GeminiClient
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from src.utils.gemini_client import GeminiClient, get_default_client
+
+# The strings are sent as an indexed list and must come back the same way
+TRANSLATION_RESPONSE_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {"type": "array", "items": {"type": "string"}},
+}
+
+
+def _translatable_fields(results: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], str]]:
+    """Yield ``(container, key)`` for every AI-generated string to translate.
+
+    Fields covered:
+    1. phases.system_analysis.rationale
+    2. phases.evidence_analysis.document_analyses[]:
+       - document_purpose
+       - controls_addressed[ID].evidence_summary
+    3. phases.recommendations.{high,medium}_priority[].action
+    """
+    phases = results.get("phases", {})
+
+    # System Analysis Rationale
+    system_analysis = phases.get("system_analysis")
+    if system_analysis and "rationale" in system_analysis:
+        yield system_analysis, "rationale"
+
+    # Evidence Summaries
+    if "evidence_analysis" in phases:
+        for doc in phases["evidence_analysis"].get("document_analyses", []):
+            if "document_purpose" in doc:
+                yield doc, "document_purpose"
+            for ev in doc.get("controls_addressed", {}).values():
+                if "evidence_summary" in ev:
+                    yield ev, "evidence_summary"
+
+    # Recommendations
+    if "recommendations" in phases:
+        for priority in ("high_priority", "medium_priority"):
+            for item in phases["recommendations"].get(priority, []):
+                if "action" in item:
+                    yield item, "action"
 
 
 class Localizer:
     """Utility to translate AI-generated findings."""
 
-    def __init__(self):
-        self.client = GeminiClient()
+    def __init__(self, client: Optional[GeminiClient] = None):
+        self.client = client or get_default_client()
 
     async def translate_results(self, results: Dict[str, Any], target_lang: str) -> Dict[str, Any]:
         """
@@ -21,97 +62,39 @@ class Localizer:
         if target_lang == "en":
             return results
 
-        # Create a deep copy
-        localized = json.loads(json.dumps(results))
-
-        # Fields to translate:
-        # 1. results["phases"]["system_analysis"]["rationale"]
-        # 2. Each item in results["phases"]["evidence_analysis"]["document_analyses"]:
-        #    - "document_purpose"
-        #    - "controls_addressed"[ID]["evidence_summary"]
-        # 3. recommendations["high_priority"][]["action"]
-
-        to_translate = []
-
-        # System Analysis Rationale
-        if "system_analysis" in localized.get("phases", {}):
-            if "rationale" in localized["phases"]["system_analysis"]:
-                to_translate.append(
-                    ("sa_rationale", localized["phases"]["system_analysis"]["rationale"])
-                )
-
-        # Evidence Summaries
-        if "evidence_analysis" in localized.get("phases", {}):
-            for i, doc in enumerate(
-                localized["phases"]["evidence_analysis"].get("document_analyses", [])
-            ):
-                if "document_purpose" in doc:
-                    to_translate.append((f"doc_{i}_purpose", doc["document_purpose"]))
-                for ctrl_id, ev in doc.get("controls_addressed", {}).items():
-                    if "evidence_summary" in ev:
-                        to_translate.append(
-                            (f"doc_{i}_ctrl_{ctrl_id}_summary", ev["evidence_summary"])
-                        )
-
-        # Recommendations
-        if "recommendations" in localized.get("phases", {}):
-            for i, item in enumerate(
-                localized["phases"]["recommendations"].get("high_priority", [])
-            ):
-                if "action" in item:
-                    to_translate.append((f"rec_high_{i}_action", item["action"]))
-            for i, item in enumerate(
-                localized["phases"]["recommendations"].get("medium_priority", [])
-            ):
-                if "action" in item:
-                    to_translate.append((f"rec_med_{i}_action", item["action"]))
-
-        if not to_translate:
-            return localized
+        # Collected from the original in a single walk
+        fields: List[Tuple[Dict[str, Any], str]] = list(_translatable_fields(results))
+        if not fields:
+            return results
 
         # Bulk translate strings
         prompt = f"""
         Translate the following technical security assessment findings from English to French.
         Maintain technical accuracy and professional tone for a Canadian Government audience.
-        Return ONLY a JSON object mapping the keys back to the translated values.
-        
+        Return ONLY a JSON array of the translated strings, in the same order.
+
         Strings to translate:
-        {json.dumps(dict(to_translate), indent=2)}
+        {json.dumps([container[key] for container, key in fields], indent=2)}
         """
 
-        try:
-            response = await self.client.generate_async(prompt)
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0].strip()
+        # deepcopy records each original container's copy in the memo, so the
+        # translations can be written straight into the copy without a second walk
+        memo: Dict[int, Any] = {}
+        localized = copy.deepcopy(results, memo)
 
+        try:
+            response = await self.client.generate_async(
+                prompt, generation_config=TRANSLATION_RESPONSE_CONFIG
+            )
             translations = json.loads(response)
+            if len(translations) != len(fields):
+                raise ValueError(
+                    f"expected {len(fields)} translations, got {len(translations)}"
+                )
 
             # Apply translations back
-            if "sa_rationale" in translations:
-                localized["phases"]["system_analysis"]["rationale"] = translations["sa_rationale"]
-
-            for i, doc in enumerate(
-                localized["phases"]["evidence_analysis"].get("document_analyses", [])
-            ):
-                if f"doc_{i}_purpose" in translations:
-                    doc["document_purpose"] = translations[f"doc_{i}_purpose"]
-                for ctrl_id, ev in doc.get("controls_addressed", {}).items():
-                    if f"doc_{i}_ctrl_{ctrl_id}_summary" in translations:
-                        ev["evidence_summary"] = translations[f"doc_{i}_ctrl_{ctrl_id}_summary"]
-
-            if "recommendations" in localized.get("phases", {}):
-                for i, item in enumerate(
-                    localized["phases"]["recommendations"].get("high_priority", [])
-                ):
-                    if f"rec_high_{i}_action" in translations:
-                        item["action"] = translations[f"rec_high_{i}_action"]
-                for i, item in enumerate(
-                    localized["phases"]["recommendations"].get("medium_priority", [])
-                ):
-                    if f"rec_med_{i}_action" in translations:
-                        item["action"] = translations[f"rec_med_{i}_action"]
+            for (container, key), translated in zip(fields, translations):
+                memo[id(container)][key] = translated
 
         except Exception as e:
             print(f"Localization failed: {e}")
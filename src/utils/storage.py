@@ -1,26 +1,295 @@
 """Storage manager for assessment data."""
 
+import asyncio
+import hashlib
+import io
+import itertools
+import logging
 import os
-import json
-import uuid
+import secrets
 import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-import aiofiles
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple, Union
+from datetime import datetime, timezone
+import orjson
 from fastapi import UploadFile
 
+logger = logging.getLogger(__name__)
+
+# Metadata changes made within this window are written out together
+METADATA_FLUSH_DELAY_SECONDS = 0.03
+UPLOAD_COPY_CHUNK_BYTES = 1024 * 1024
+UPLOAD_SENDFILE_BYTES = 4 * 1024 * 1024
+SECONDS_PER_DAY = 24 * 60 * 60
+MAX_RUN_HISTORY = 20
+INDEX_DB_NAME = "assessment_index.db"
+
+# Result snapshots are stored once per distinct content under
+# <outputs>/cas/<assessment>/<sha256>.json
+RESULTS_CAS_DIR = "cas"
+
+# Per-file records are stored one file each under <assessment>/docs/
+SIDECAR_DIR = "docs"
+FILE_COLLECTIONS = ("documents", "diagrams", "videos")
+# Collection for an upload by major MIME type; anything else is a document
+_UPLOAD_COLLECTIONS = {"image": "diagrams", "video": "videos"}
+
+# Per-collection counters kept on the record so status polls skip the lists
+_COUNT_FIELDS = {
+    "documents": "document_count",
+    "diagrams": "diagram_count",
+    "videos": "video_count",
+}
+
+# Distinguishes temp files of concurrent writes to the same path
+_tmp_counter = itertools.count()
+
+# Purges unlink files from several threads so the filesystem can overlap
+# the metadata updates
+_UNLINK_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="storage-unlink")
+
+_INDEX_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+)
+_UPSERT_INDEX_SQL = """
+    INSERT INTO assessments (
+        assessment_id, project_name, client_id, status, created_at,
+        deleted, deleted_at, deleted_at_epoch
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT (assessment_id) DO UPDATE SET
+        project_name = excluded.project_name,
+        client_id = excluded.client_id,
+        status = excluded.status,
+        created_at = excluded.created_at,
+        deleted = excluded.deleted,
+        deleted_at = excluded.deleted_at,
+        deleted_at_epoch = excluded.deleted_at_epoch
+"""
+_INDEX_COLUMNS = "assessment_id, project_name, client_id, status, created_at, deleted, deleted_at"
+_LIST_ACTIVE_SQL = f"SELECT {_INDEX_COLUMNS} FROM assessments WHERE deleted = 0 ORDER BY rowid"
+_LIST_ALL_SQL = f"SELECT {_INDEX_COLUMNS} FROM assessments ORDER BY rowid"
+_EXPIRED_DELETED_SQL = (
+    "SELECT assessment_id FROM assessments WHERE deleted = 1 AND deleted_at_epoch <= ?"
+)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact JSON bytes."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _loads(data: bytes) -> Any:
+    """Decode JSON bytes."""
+    return orjson.loads(data)
+
+
+def _copy_upload(src: BinaryIO, dst_path: str) -> int:
+    """Copy an upload from its current position to ``dst_path``.
+
+    Uploads backed by a real file are copied in the kernel with
+    ``os.sendfile``; objects without a file descriptor fall back to
+    ``shutil.copyfileobj``. Returns the number of bytes written.
+    """
+    with open(dst_path, "wb") as dst:
+        # Only the public fileno() is consulted. For an in-memory
+        # SpooledTemporaryFile it rolls the (spool-limit sized) data over to
+        # disk first, which is cheap next to the copy it saves
+        try:
+            in_fd = src.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            in_fd = None
+        if in_fd is not None:
+            start = offset = src.tell()
+            while sent := os.sendfile(dst.fileno(), in_fd, offset, UPLOAD_SENDFILE_BYTES):
+                offset += sent
+            return offset - start
+
+        shutil.copyfileobj(src, dst, UPLOAD_COPY_CHUNK_BYTES)
+        return dst.tell()
+
+
+def _index_row(assessment_id: str, assessment: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the index columns for an assessment, in _UPSERT_INDEX_SQL order."""
+    return (
+        assessment_id,
+        assessment.get("project_name"),
+        assessment.get("client_id"),
+        assessment.get("status"),
+        assessment.get("created_at"),
+        int(bool(assessment.get("deleted", False))),
+        assessment.get("deleted_at"),
+        _deleted_at_epoch(assessment),
+    )
+
+
+def _deleted_at_epoch(assessment: Dict[str, Any]) -> Optional[int]:
+    """Return when a deleted assessment was deleted, in Unix seconds."""
+    if not assessment.get("deleted"):
+        return None
+    epoch = assessment.get("deleted_at_epoch")
+    if epoch is not None:
+        return epoch
+
+    # Records deleted before the epoch was stored only have the ISO string
+    try:
+        deleted_time = datetime.fromisoformat(assessment.get("deleted_at") or "")
+    except ValueError:
+        return None
+    if deleted_time.tzinfo is None:
+        # Written by utcnow() before timestamps carried an offset
+        deleted_time = deleted_time.replace(tzinfo=timezone.utc)
+    return int(deleted_time.timestamp())
+
+
+def _unlink_all(paths: List[Union[str, Path]]) -> None:
+    """Unlink files in parallel, ignoring any that cannot be removed."""
+    for _ in _UNLINK_POOL.map(_unlink_quietly, paths):
+        pass
+
+
+def _unlink_quietly(path: Union[str, Path]) -> None:
+    """Unlink a file, ignoring errors."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _remove_tree(root: Path) -> None:
+    """Delete a directory tree, unlinking its files in parallel.
+
+    Errors are ignored, as with ``shutil.rmtree(..., ignore_errors=True)``.
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    stack = [os.fspath(root)]
+    while stack:
+        path = stack.pop()
+        dirs.append(path)
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError:
+            continue
+
+    _unlink_all(files)
+    # Parents were appended before their children, so reverse order is bottom-up
+    for path in reversed(dirs):
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
+
+
+def _write_bytes_atomic(path: Path, data: bytes, durable: bool = False) -> None:
+    """Replace ``path`` with ``data`` via a temp file and rename.
+
+    Readers and crashes see either the old or the new contents, never a
+    partial write. The data is only fsynced when ``durable`` is set. Called
+    through ``asyncio.to_thread`` so the whole write is one executor hop.
+    """
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}.{next(_tmp_counter)}")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        _unlink_quietly(tmp)
+        raise
+
+
+def _read_json_files(paths: List[Path]) -> List[Any]:
+    """Read and decode each JSON file in ``paths``, in order."""
+    return [_loads(path.read_bytes()) for path in paths]
+
+
+def _write_results_files(
+    output_dir: Path, assessment_id: str, results: Dict[str, Any], link_names: Tuple[str, ...]
+) -> str:
+    """Store results once under their SHA-256 and point ``link_names`` at them.
+
+    Reruns that produce identical results reuse the existing copy. Runs in a
+    worker thread, encoding included, since results can be large. Returns the
+    hex digest.
+    """
+    data = _dumps(results)
+    digest = hashlib.sha256(data).hexdigest()
+    blob_rel = os.path.join(RESULTS_CAS_DIR, assessment_id, f"{digest}.json")
+    blob = output_dir / blob_rel
+    if not blob.exists():
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f"{digest}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, blob)
+
+    for name in link_names:
+        # Swap the link in with a rename so readers never see it missing
+        tmp_link = output_dir / f".{name}.tmp"
+        _unlink_quietly(tmp_link)
+        os.symlink(blob_rel, tmp_link)
+        os.replace(tmp_link, output_dir / name)
+    return digest
+
+
+def _prune_results_files(output_dir: Path, names: List[str], live_names: List[str]) -> None:
+    """Remove result snapshot links, and any stored copy no live link still uses."""
+
+    def target(name: str) -> Optional[str]:
+        try:
+            return os.readlink(output_dir / name)
+        except OSError:
+            return None
+
+    live_targets = {target(name) for name in live_names}
+    orphaned = {target(name) for name in names} - live_targets - {None}
+    _unlink_all([output_dir / name for name in names])
+    _unlink_all([output_dir / blob for blob in orphaned])
+
+
+def _next_run_id(history: List[Dict[str, Any]]) -> int:
+    """Return the id for a new run; ids keep increasing after old runs are dropped."""
+    return history[-1]["run_id"] + 1 if history else 1
+
+
+def _sidecar_pointer(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the stand-in kept in metadata.json for a record stored in a sidecar."""
+    return {"file_id": record["file_id"], "filename": record.get("filename"), "sidecar": True}
+
+
+def _utcnow_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
+
 
 class StorageManager:
     """Manages storage of assessment data and uploaded files."""
 
     def __init__(
-        self, upload_dir: str = "./uploads", output_dir: str = "./outputs", data_dir: str = "./data"
+        self,
+        upload_dir: str = "./uploads",
+        output_dir: str = "./outputs",
+        data_dir: str = "./data",
+        max_run_history: int = MAX_RUN_HISTORY,
     ):
         """Initialize storage manager."""
         self.upload_dir = Path(upload_dir)
+        self._upload_dir_str = os.fspath(self.upload_dir)
         self.output_dir = Path(output_dir)
         self.data_dir = Path(data_dir)
+        self.max_run_history = max_run_history
 
         # Create directories
         self.upload_dir.mkdir(parents=True, exist_ok=True)
@@ -30,21 +299,42 @@ class StorageManager:
         # In-memory storage (would use database in production)
         self._assessments: Dict[str, Dict[str, Any]] = {}
 
+        # In-flight disk loads, keyed by assessment id
+        self._loading: Dict[str, asyncio.Future] = {}
+
+        # File ids per assessment whose record lives in a sidecar file
+        self._sidecar_ids: Dict[str, Set[str]] = {}
+
+        # Assessments whose metadata.json is behind the in-memory record
+        self._dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        # Metadata writes started by flush() that have not finished yet
+        self._flush_writes: Set[asyncio.Future] = set()
+
+        # Listing fields per assessment; metadata.json remains the source of
+        # truth. Opened on first use so constructing the manager (e.g. at
+        # import of the app) creates no database file.
+        self._index_conn: Optional[sqlite3.Connection] = None
+
     async def create_assessment(
         self, assessment_id: str, client_id: str, project_name: str, conops: Optional[str] = None
     ) -> Dict[str, Any]:
         """Create new assessment record."""
+        now = _utcnow_iso()
         assessment = {
             "assessment_id": assessment_id,
             "client_id": client_id,
             "project_name": project_name,
             "conops": conops,
             "status": "created",
-            "created_at": datetime.utcnow().isoformat(),
-            "updated_at": datetime.utcnow().isoformat(),
+            "created_at": now,
+            "updated_at": now,
             "documents": [],
             "diagrams": [],
             "videos": [],
+            "document_count": 0,
+            "diagram_count": 0,
+            "video_count": 0,
             "results": None,
             "run_history": [],  # Track all assessment runs
             "deleted": False,
@@ -68,19 +358,29 @@ class StorageManager:
         if assessment_id in self._assessments:
             return self._assessments[assessment_id]
 
-        # Try to load from disk
+        # Concurrent misses for the same assessment share one disk read
+        loading = self._loading.get(assessment_id)
+        if loading is None:
+            loading = asyncio.ensure_future(self._load_assessment(assessment_id))
+            self._loading[assessment_id] = loading
+            loading.add_done_callback(lambda _: self._loading.pop(assessment_id, None))
+        # A cancelled caller must not cancel the load for everyone else
+        return await asyncio.shield(loading)
+
+    async def _load_assessment(self, assessment_id: str) -> Optional[Dict[str, Any]]:
+        """Load an assessment from disk into the in-memory store."""
         metadata_path = self.upload_dir / assessment_id / "metadata.json"
-        if metadata_path.exists():
-            async with aiofiles.open(metadata_path, "r") as f:
-                content = await f.read()
-                assessment = json.loads(content)
-                assessment.setdefault("deleted", False)
-                assessment.setdefault("deleted_at", None)
-                assessment.setdefault("delete_reason", None)
-                self._assessments[assessment_id] = assessment
-                return assessment
+        if not metadata_path.exists():
+            return None
 
-        return None
+        assessment = _loads(await asyncio.to_thread(metadata_path.read_bytes))
+        assessment.setdefault("deleted", False)
+        assessment.setdefault("deleted_at", None)
+        assessment.setdefault("delete_reason", None)
+        for collection, count_field in _COUNT_FIELDS.items():
+            assessment.setdefault(count_field, len(assessment.get(collection, [])))
+        await self._load_sidecars(assessment_id, assessment)
+        return self._assessments.setdefault(assessment_id, assessment)
 
     async def save_upload(
         self,
@@ -89,49 +389,46 @@ class StorageManager:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> Path:
         """Save uploaded file using streaming to handle large files."""
-        assessment_dir = self.upload_dir / assessment_id
-        assessment_dir.mkdir(parents=True, exist_ok=True)
+        # Plain string paths inside; a Path is only built for the caller
+        assessment_dir = os.path.join(self._upload_dir_str, assessment_id)
+        os.makedirs(assessment_dir, exist_ok=True)
 
         # Generate unique filename
-        file_id = str(uuid.uuid4())[:8]
+        file_id = secrets.token_hex(4)
         safe_filename = f"{file_id}_{file.filename}"
-        file_path = assessment_dir / safe_filename
+        file_path = os.path.join(assessment_dir, safe_filename)
 
-        # Save file using chunks to avoid memory issues with large files
-        file_size = 0
-        async with aiofiles.open(file_path, "wb") as f:
-            while chunk := await file.read(1024 * 1024):  # 1MB chunks
-                await f.write(chunk)
-                file_size += len(chunk)
+        # Copy the spooled upload in one worker-thread call rather than
+        # hopping to a thread for every chunk read and written
+        file_size = await asyncio.to_thread(_copy_upload, file.file, file_path)
 
         # Update assessment record
         if assessment_id in self._assessments:
+            now = _utcnow_iso()
             file_record = {
                 "file_id": file_id,
                 "filename": file.filename,
                 "saved_as": safe_filename,
-                "path": str(file_path),
+                "path": file_path,
                 "content_type": file.content_type,
                 "size": file_size,
-                "uploaded_at": datetime.utcnow().isoformat(),
+                "uploaded_at": now,
                 "user_metadata": metadata or {},
                 "significance_note": (metadata or {}).get("significance_note"),
             }
+            await self._write_sidecar(assessment_id, file_record)
 
-            # Categorize as document or diagram
-            if file.content_type and file.content_type.startswith("image/"):
-                self._assessments[assessment_id]["diagrams"].append(file_record)
-            elif file.content_type and file.content_type.startswith("video/"):
-                # We can add a 'videos' list or keep them in documents for now
-                if "videos" not in self._assessments[assessment_id]:
-                    self._assessments[assessment_id]["videos"] = []
-                self._assessments[assessment_id]["videos"].append(file_record)
-            else:
-                self._assessments[assessment_id]["documents"].append(file_record)
+            # Categorize as document, diagram or video by major MIME type
+            major_type = (file.content_type or "").partition("/")[0]
+            collection = _UPLOAD_COLLECTIONS.get(major_type, "documents")
+            assessment = self._assessments[assessment_id]
+            assessment.setdefault(collection, []).append(file_record)
+            count_field = _COUNT_FIELDS[collection]
+            assessment[count_field] = assessment.get(count_field, 0) + 1
 
-            await self._save_assessment_metadata(assessment_id, self._assessments[assessment_id])
+            self._mark_dirty(assessment_id)
 
-        return file_path
+        return Path(file_path)
 
     async def get_documents(self, assessment_id: str) -> List[Dict[str, Any]]:
         """Get all documents for an assessment."""
@@ -163,9 +460,17 @@ class StorageManager:
         if "documents" not in assessment:
             assessment["documents"] = []
 
+        await asyncio.gather(
+            *(
+                self._write_sidecar(assessment_id, doc)
+                for doc in documents
+                if doc.get("file_id")
+            )
+        )
         assessment["documents"].extend(documents)
-        assessment["updated_at"] = datetime.utcnow().isoformat()
-        await self._save_assessment_metadata(assessment_id, assessment)
+        assessment["document_count"] = len(assessment["documents"])
+        assessment["updated_at"] = _utcnow_iso()
+        self._mark_dirty(assessment_id)
 
     async def update_document_metadata(
         self, assessment_id: str, file_id: str, significance_note: Optional[str]
@@ -175,16 +480,19 @@ class StorageManager:
         if not assessment:
             return None
 
-        collections = ["documents", "diagrams", "videos"]
-        for collection in collections:
+        for collection in FILE_COLLECTIONS:
             items = assessment.get(collection, [])
             for item in items:
                 if item.get("file_id") == file_id:
                     item.setdefault("user_metadata", {})
                     item["user_metadata"]["significance_note"] = significance_note
                     item["significance_note"] = significance_note
-                    assessment["updated_at"] = datetime.utcnow().isoformat()
-                    await self._save_assessment_metadata(assessment_id, assessment)
+                    # Only this record's sidecar is rewritten; metadata.json
+                    # holds a pointer to it
+                    if file_id in self._sidecar_ids.get(assessment_id, ()):
+                        await self._write_sidecar(assessment_id, item)
+                    assessment["updated_at"] = _utcnow_iso()
+                    self._mark_dirty(assessment_id)
                     return item
 
         return None
@@ -194,35 +502,69 @@ class StorageManager:
     ) -> None:
         """Store assessment results, optionally preserving history."""
         if assessment_id in self._assessments:
-            now = datetime.utcnow().isoformat()
+            assessment = self._assessments[assessment_id]
+            now = _utcnow_iso()
+            evicted_files: List[str] = []
 
             # Preserve previous run in history if there was one
-            if preserve_history and self._assessments[assessment_id].get("results"):
+            if preserve_history and assessment.get("results"):
+                history = assessment.setdefault("run_history", [])
                 previous_run = {
-                    "run_id": len(self._assessments[assessment_id].get("run_history", [])) + 1,
-                    "completed_at": self._assessments[assessment_id].get("updated_at"),
-                    "results": self._assessments[assessment_id]["results"],
-                    "document_count": len(self._assessments[assessment_id].get("documents", [])),
+                    "run_id": _next_run_id(history),
+                    "completed_at": assessment.get("updated_at"),
+                    "results": assessment["results"],
+                    "document_count": len(assessment.get("documents", [])),
+                    "results_files": assessment.pop("results_files", []),
                 }
-                if "run_history" not in self._assessments[assessment_id]:
-                    self._assessments[assessment_id]["run_history"] = []
-                self._assessments[assessment_id]["run_history"].append(previous_run)
-
-            self._assessments[assessment_id]["results"] = results
-            self._assessments[assessment_id]["status"] = "completed"
-            self._assessments[assessment_id]["updated_at"] = now
-
-            await self._save_assessment_metadata(assessment_id, self._assessments[assessment_id])
+                history.append(previous_run)
+
+                # Oldest runs beyond the cap are dropped with their snapshots,
+                # which keeps metadata.json from growing with every rerun
+                if len(history) > self.max_run_history:
+                    for run in history[: -self.max_run_history]:
+                        evicted_files.extend(run.get("results_files", []))
+                    del history[: -self.max_run_history]
+            else:
+                # Without history the new snapshot replaces the current run's
+                # instead of piling up next to it
+                evicted_files.extend(assessment.pop("results_files", []))
+
+            results_name = f"{assessment_id}_results.json"
+            history_name = f"{assessment_id}_results_{now.replace(':', '-')}.json"
+
+            assessment["results"] = results
+            assessment["status"] = "completed"
+            assessment["updated_at"] = now
+            assessment.setdefault("results_files", []).append(history_name)
+            evicted_files = [name for name in evicted_files if name != history_name]
+            # Recorded so purging needs no scan of the outputs directory
+            output_files = assessment.setdefault("output_files", [])
+            for name in (results_name, history_name):
+                if name not in output_files:
+                    output_files.append(name)
+            if evicted_files:
+                evicted = set(evicted_files)
+                output_files[:] = [name for name in output_files if name not in evicted]
+
+            # Save results to separate file, plus a timestamped version for
+            # history; both link to one content-addressed copy
+            assessment["results_digest"] = await asyncio.to_thread(
+                _write_results_files,
+                self.output_dir,
+                assessment_id,
+                results,
+                (results_name, history_name),
+            )
 
-            # Save results to separate file
-            results_path = self.output_dir / f"{assessment_id}_results.json"
-            async with aiofiles.open(results_path, "w") as f:
-                await f.write(json.dumps(results, indent=2))
+            # Results are written straight through; this save covers any
+            # pending metadata changes as well
+            self._dirty.discard(assessment_id)
+            await self._save_assessment_metadata(assessment_id, assessment)
 
-            # Also save timestamped version for history
-            history_path = self.output_dir / f"{assessment_id}_results_{now.replace(':', '-')}.json"
-            async with aiofiles.open(history_path, "w") as f:
-                await f.write(json.dumps(results, indent=2))
+            if evicted_files:
+                await asyncio.to_thread(
+                    _prune_results_files, self.output_dir, evicted_files, output_files
+                )
 
     async def get_run_history(self, assessment_id: str) -> List[Dict[str, Any]]:
         """Get assessment run history."""
@@ -248,9 +590,9 @@ class StorageManager:
                 "status": assessment.get("status"),
                 "created_at": assessment.get("created_at"),
                 "updated_at": assessment.get("updated_at"),
-                "document_count": len(assessment.get("documents", [])),
-                "diagram_count": len(assessment.get("diagrams", [])),
-                "video_count": len(assessment.get("videos", [])),
+                "document_count": assessment.get("document_count", 0),
+                "diagram_count": assessment.get("diagram_count", 0),
+                "video_count": assessment.get("video_count", 0),
             }
         return None
 
@@ -269,96 +611,201 @@ class StorageManager:
         return None
 
     async def _save_assessment_metadata(
-        self, assessment_id: str, assessment: Dict[str, Any]
+        self, assessment_id: str, assessment: Dict[str, Any], durable: bool = False
     ) -> None:
-        """Save assessment metadata to disk."""
+        """Save assessment metadata to disk.
+
+        Assessments purged while a save is pending are neither written nor
+        put back in the index.
+        """
+        if assessment_id not in self._assessments:
+            return
         metadata_path = self.upload_dir / assessment_id / "metadata.json"
-        async with aiofiles.open(metadata_path, "w") as f:
-            await f.write(json.dumps(assessment, indent=2))
+        stored = self._with_sidecar_pointers(assessment_id, assessment)
+        if stored.get("results") or stored.get("run_history"):
+            # Results dominate the size; encode those off the event loop
+            data = await asyncio.to_thread(_dumps, stored)
+        else:
+            data = _dumps(stored)
+        await asyncio.to_thread(_write_bytes_atomic, metadata_path, data, durable)
+        if assessment_id in self._assessments:
+            self._index_upsert(assessment_id, assessment)
+
+    def _sidecar_path(self, assessment_id: str, file_id: str) -> Path:
+        """Return the sidecar path of a file record."""
+        return self.upload_dir / assessment_id / SIDECAR_DIR / f"{file_id}.json"
+
+    async def _write_sidecar(self, assessment_id: str, record: Dict[str, Any]) -> None:
+        """Write a file record to its own sidecar file."""
+        path = self._sidecar_path(assessment_id, record["file_id"])
+        path.parent.mkdir(exist_ok=True)
+        await asyncio.to_thread(_write_bytes_atomic, path, _dumps(record))
+        self._sidecar_ids.setdefault(assessment_id, set()).add(record["file_id"])
+
+    def _with_sidecar_pointers(
+        self, assessment_id: str, assessment: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Return the on-disk form of an assessment.
+
+        File records that have a sidecar are replaced by a pointer; records
+        loaded from older metadata without one stay inline.
+        """
+        sidecar_ids = self._sidecar_ids.get(assessment_id)
+        if not sidecar_ids:
+            return assessment
+
+        stored = dict(assessment)
+        for collection in FILE_COLLECTIONS:
+            if collection in assessment:
+                stored[collection] = [
+                    _sidecar_pointer(record) if record.get("file_id") in sidecar_ids else record
+                    for record in assessment[collection]
+                ]
+        return stored
+
+    async def _load_sidecars(self, assessment_id: str, assessment: Dict[str, Any]) -> None:
+        """Replace sidecar pointers in freshly loaded metadata with their records."""
+        pointers = []
+        for collection in FILE_COLLECTIONS:
+            records = assessment.get(collection, [])
+            for i, record in enumerate(records):
+                if record.get("sidecar"):
+                    pointers.append((records, i, record["file_id"]))
+        if not pointers:
+            return
+
+        loaded = await asyncio.to_thread(
+            _read_json_files,
+            [self._sidecar_path(assessment_id, file_id) for _, _, file_id in pointers],
+        )
+        for (records, i, _), record in zip(pointers, loaded):
+            records[i] = record
+        self._sidecar_ids[assessment_id] = {file_id for _, _, file_id in pointers}
+
+    def _mark_dirty(self, assessment_id: str) -> None:
+        """Schedule a metadata write, coalescing changes made in quick succession."""
+        self._dirty.add(assessment_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+
+    async def _flush_pending(self) -> None:
+        """Write out dirty metadata until no changes are pending."""
+        while self._dirty:
+            await asyncio.sleep(METADATA_FLUSH_DELAY_SECONDS)
+            if await self.flush():
+                # Failed ids stay dirty; retry on the next change or at shutdown
+                # rather than spinning on a persistent error
+                break
+
+    async def flush(self) -> List[str]:
+        """Write all pending metadata changes to disk.
+
+        Every pending assessment is attempted even if some writes fail. Failed
+        ids are put back in the dirty set and logged; their ids are returned.
+        """
+        pending, self._dirty = self._dirty, set()
+        assessment_ids = [aid for aid in pending if aid in self._assessments]
+        writes = asyncio.gather(
+            *(
+                self._save_assessment_metadata(assessment_id, self._assessments[assessment_id])
+                for assessment_id in assessment_ids
+            ),
+            return_exceptions=True,
+        )
+        self._flush_writes.add(writes)
+        try:
+            results = await writes
+        finally:
+            self._flush_writes.discard(writes)
+
+        failed = []
+        for assessment_id, result in zip(assessment_ids, results):
+            if isinstance(result, BaseException):
+                failed.append(assessment_id)
+                if assessment_id in self._assessments:
+                    self._dirty.add(assessment_id)
+                logger.error("Metadata flush failed for %s", assessment_id, exc_info=result)
+        return failed
 
     async def list_assessments(self) -> List[Dict[str, Any]]:
         """List all assessments."""
-        assessments = []
-
-        # Check in-memory cache
-        for assessment_id, assessment in self._assessments.items():
-            if assessment.get("deleted"):
-                continue
-            assessments.append(
-                {
-                    "assessment_id": assessment_id,
-                    "project_name": assessment.get("project_name"),
-                    "client_id": assessment.get("client_id"),
-                    "status": assessment.get("status"),
-                    "created_at": assessment.get("created_at"),
-                    "deleted": assessment.get("deleted", False),
-                    "deleted_at": assessment.get("deleted_at"),
-                }
-            )
-
-        # Also check disk for any not in memory
-        if self.upload_dir.exists():
-            for item in self.upload_dir.iterdir():
-                if item.is_dir() and item.name not in self._assessments:
-                    metadata_path = item / "metadata.json"
-                    if metadata_path.exists():
-                        async with aiofiles.open(metadata_path, "r") as f:
-                            content = await f.read()
-                            assessment = json.loads(content)
-                            if assessment.get("deleted"):
-                                continue
-                            assessments.append(
-                                {
-                                    "assessment_id": item.name,
-                                    "project_name": assessment.get("project_name"),
-                                    "client_id": assessment.get("client_id"),
-                                    "status": assessment.get("status"),
-                                    "created_at": assessment.get("created_at"),
-                                    "deleted": assessment.get("deleted", False),
-                                    "deleted_at": assessment.get("deleted_at"),
-                                }
-                            )
-
-        return assessments
+        return self._query_index(_LIST_ACTIVE_SQL)
 
     async def list_assessments_with_deleted(self) -> List[Dict[str, Any]]:
         """List all assessments including deleted ones."""
-        assessments = []
-
-        for assessment_id, assessment in self._assessments.items():
-            assessments.append(
-                {
-                    "assessment_id": assessment_id,
-                    "project_name": assessment.get("project_name"),
-                    "client_id": assessment.get("client_id"),
-                    "status": assessment.get("status"),
-                    "created_at": assessment.get("created_at"),
-                    "deleted": assessment.get("deleted", False),
-                    "deleted_at": assessment.get("deleted_at"),
-                }
+        return self._query_index(_LIST_ALL_SQL)
+
+    @property
+    def _index(self) -> sqlite3.Connection:
+        """The assessment index, opened and synced with disk on first use."""
+        if self._index_conn is None:
+            self._index_conn = self._open_index()
+            self._sync_index_with_disk()
+        return self._index_conn
+
+    def _open_index(self) -> sqlite3.Connection:
+        """Open the assessment index, creating the table if needed."""
+        conn = sqlite3.connect(self.data_dir / INDEX_DB_NAME, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _INDEX_PRAGMAS:
+            conn.execute(pragma)
+        with conn:
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(assessments)")}
+            if columns and "deleted_at_epoch" not in columns:
+                # The index is only a cache of metadata.json; rebuild it
+                # rather than migrate
+                conn.execute("DROP TABLE assessments")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS assessments (
+                    assessment_id TEXT PRIMARY KEY,
+                    project_name TEXT,
+                    client_id TEXT,
+                    status TEXT,
+                    created_at TEXT,
+                    deleted INTEGER NOT NULL DEFAULT 0,
+                    deleted_at TEXT,
+                    deleted_at_epoch INTEGER
+                )
+                """
             )
-
-        if self.upload_dir.exists():
-            for item in self.upload_dir.iterdir():
-                if item.is_dir() and item.name not in self._assessments:
-                    metadata_path = item / "metadata.json"
-                    if metadata_path.exists():
-                        async with aiofiles.open(metadata_path, "r") as f:
-                            content = await f.read()
-                            assessment = json.loads(content)
-                            assessments.append(
-                                {
-                                    "assessment_id": item.name,
-                                    "project_name": assessment.get("project_name"),
-                                    "client_id": assessment.get("client_id"),
-                                    "status": assessment.get("status"),
-                                    "created_at": assessment.get("created_at"),
-                                    "deleted": assessment.get("deleted", False),
-                                    "deleted_at": assessment.get("deleted_at"),
-                                }
-                            )
-
-        return assessments
+        return conn
+
+    def _sync_index_with_disk(self) -> None:
+        """Index any assessment directory the index does not know about yet.
+
+        metadata.json stays the source of truth; this covers assessments
+        written before the index existed or while it was missing.
+        """
+        known = {row[0] for row in self._index.execute("SELECT assessment_id FROM assessments")}
+        rows = []
+        # scandir's DirEntry answers is_dir from the directory listing itself,
+        # without a stat per entry
+        with os.scandir(self.upload_dir) as entries:
+            for entry in entries:
+                if entry.name in known or not entry.is_dir(follow_symlinks=False):
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "metadata.json"), "rb") as f:
+                        assessment = _loads(f.read())
+                except FileNotFoundError:
+                    continue
+                rows.append(_index_row(entry.name, assessment))
+        if rows:
+            with self._index:
+                self._index.executemany(_UPSERT_INDEX_SQL, rows)
+
+    def _index_upsert(self, assessment_id: str, assessment: Dict[str, Any]) -> None:
+        """Record an assessment's listing fields in the index."""
+        with self._index:
+            self._index.execute(_UPSERT_INDEX_SQL, _index_row(assessment_id, assessment))
+
+    def _query_index(self, sql: str) -> List[Dict[str, Any]]:
+        """Run a listing query against the index."""
+        return [
+            {**row, "deleted": bool(row["deleted"])}
+            for row in map(dict, self._index.execute(sql))
+        ]
 
     async def soft_delete_assessment(
         self, assessment_id: str, reason: Optional[str] = None
@@ -368,11 +815,15 @@ class StorageManager:
         if not assessment:
             return None
 
+        now = _utcnow_iso()
         assessment["deleted"] = True
-        assessment["deleted_at"] = datetime.utcnow().isoformat()
+        assessment["deleted_at"] = now
+        assessment["deleted_at_epoch"] = int(time.time())
         assessment["delete_reason"] = reason
-        assessment["updated_at"] = datetime.utcnow().isoformat()
-        await self._save_assessment_metadata(assessment_id, assessment)
+        assessment["updated_at"] = now
+        # Listings read the index, so it is updated now rather than on flush
+        self._index_upsert(assessment_id, assessment)
+        self._mark_dirty(assessment_id)
         return assessment
 
     async def restore_assessment(self, assessment_id: str) -> Optional[Dict[str, Any]]:
@@ -383,50 +834,56 @@ class StorageManager:
 
         assessment["deleted"] = False
         assessment["deleted_at"] = None
+        assessment["deleted_at_epoch"] = None
         assessment["delete_reason"] = None
-        assessment["updated_at"] = datetime.utcnow().isoformat()
-        await self._save_assessment_metadata(assessment_id, assessment)
+        assessment["updated_at"] = _utcnow_iso()
+        self._index_upsert(assessment_id, assessment)
+        self._mark_dirty(assessment_id)
         return assessment
 
     async def purge_assessment(self, assessment_id: str) -> bool:
         """Permanently delete an assessment and its files."""
+        assessment = await self.get_assessment(assessment_id)
+        output_files = assessment.get("output_files") if assessment else None
+
+        # A flush already past its dirty-set swap could otherwise finish after
+        # the purge and rewrite the metadata and index row
+        while self._flush_writes:
+            await asyncio.gather(*self._flush_writes)
+
         # Remove from memory
         if assessment_id in self._assessments:
             del self._assessments[assessment_id]
+        self._dirty.discard(assessment_id)
+        self._sidecar_ids.pop(assessment_id, None)
+        with self._index:
+            self._index.execute("DELETE FROM assessments WHERE assessment_id = ?", (assessment_id,))
 
         # Remove uploads directory
         assessment_dir = self.upload_dir / assessment_id
         if assessment_dir.exists():
-            shutil.rmtree(assessment_dir, ignore_errors=True)
+            await asyncio.to_thread(_remove_tree, assessment_dir)
 
         # Remove outputs
-        if self.output_dir.exists():
-            for output_file in self.output_dir.glob(f"{assessment_id}_results*.json"):
-                try:
-                    output_file.unlink()
-                except Exception:
-                    pass
+        if output_files is not None:
+            await asyncio.to_thread(_unlink_all, [self.output_dir / name for name in output_files])
+        elif self.output_dir.exists():
+            # Assessments stored before output files were recorded
+            legacy_files = list(self.output_dir.glob(f"{assessment_id}_results*.json"))
+            await asyncio.to_thread(_unlink_all, legacy_files)
+        cas_dir = self.output_dir / RESULTS_CAS_DIR / assessment_id
+        if cas_dir.exists():
+            await asyncio.to_thread(_remove_tree, cas_dir)
 
         return True
 
     async def purge_expired_assessments(self, days: int = 30) -> List[str]:
         """Purge assessments that have been soft-deleted longer than the given days."""
-        purged = []
-        now = datetime.utcnow()
-
-        for assessment in await self.list_assessments_with_deleted():
-            if not assessment.get("deleted"):
-                continue
-            deleted_at = assessment.get("deleted_at")
-            if not deleted_at:
-                continue
-            try:
-                deleted_time = datetime.fromisoformat(deleted_at)
-            except ValueError:
-                continue
-
-            if (now - deleted_time).days >= days:
-                await self.purge_assessment(assessment["assessment_id"])
-                purged.append(assessment["assessment_id"])
+        cutoff = int(time.time()) - days * SECONDS_PER_DAY
+        purged = [
+            row[0] for row in self._index.execute(_EXPIRED_DELETED_SQL, (cutoff,)).fetchall()
+        ]
+        for assessment_id in purged:
+            await self.purge_assessment(assessment_id)
 
         return purged
@@ -1,37 +1,68 @@
 """Tests for MCP servers."""
 
+import asyncio
+from types import MappingProxyType
+
 import pytest
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock
+
+from src.mcp_servers.control_mapper.server import determine_profile
+from src.mcp_servers.control_mapper.tools import calculate_impact_level, get_baseline_controls
+from src.mcp_servers.gap_analyzer.tools import (
+    calculate_severity,
+    calculate_compliance_score,
+    GapSeverity,
+)
+from src.mcp_servers.knowledge_base import server as knowledge_base_server
+from src.mcp_servers.knowledge_base.server import search_controls, get_control_families
+from src.mcp_servers.report_generator.tools import generate_findings_section
+from src.models.evidence import Gap
+
+# Query result returned by the mocked ChromaDB collection
+_SEARCH_RESULT = {
+    "documents": [["Test control description"]],
+    "metadatas": [[{"family": "AC", "profile": 1}]],
+    "ids": [["AC-1"]],
+    "distances": [[0.5]],
+}
+
+# Categorizations for the low, moderate and high impact profiles
+_CAT_LOW = MappingProxyType({"confidentiality": "Low", "integrity": "Low", "availability": "Low"})
+_CAT_MOD = MappingProxyType(
+    {"confidentiality": "Moderate", "integrity": "Low", "availability": "Low"}
+)
+_CAT_HIGH = MappingProxyType(
+    {"confidentiality": "High", "integrity": "Low", "availability": "Moderate"}
+)
+
+
+@pytest.fixture(scope="module")
+def mock_kb_collection():
+    """Build the mock knowledge base collection once per module."""
+    collection = MagicMock()
+    collection.query.return_value = _SEARCH_RESULT
+    return collection
 
 
 class TestKnowledgeBaseMCP:
     """Tests for Knowledge Base MCP Server."""
 
-    @pytest.mark.asyncio
-    async def test_search_controls_returns_list(self):
-        """Test that search_controls returns a list."""
-        from src.mcp_servers.knowledge_base.server import search_controls
-
-        # Mock the collection
-        with patch("src.mcp_servers.knowledge_base.server.collection") as mock_collection:
-            mock_collection.query.return_value = {
-                "documents": [["Test control description"]],
-                "metadatas": [[{"family": "AC", "profile": 1}]],
-                "ids": [["AC-1"]],
-                "distances": [[0.5]],
-            }
+    @pytest.fixture
+    def mock_collection(self, monkeypatch, mock_kb_collection):
+        """Swap the ChromaDB collection for the shared mock."""
+        monkeypatch.setattr(knowledge_base_server, "collection", mock_kb_collection)
+        return mock_kb_collection
 
-            result = await search_controls("access control")
+    async def test_search_controls_returns_list(self, mock_collection):
+        """Test that search_controls returns a list."""
+        result = await search_controls("access control")
 
-            assert isinstance(result, list)
-            assert len(result) == 1
-            assert result[0]["id"] == "AC-1"
+        assert isinstance(result, list)
+        assert len(result) == 1
+        assert result[0]["id"] == "AC-1"
 
-    @pytest.mark.asyncio
     async def test_get_control_families_returns_list(self):
         """Test that get_control_families returns all families."""
-        from src.mcp_servers.knowledge_base.server import get_control_families
-
         result = await get_control_families()
 
         assert isinstance(result, list)
@@ -45,50 +76,14 @@ class TestKnowledgeBaseMCP:
 class TestControlMapperMCP:
     """Tests for Control Mapper MCP Server."""
 
-    @pytest.mark.asyncio
-    async def test_determine_profile_low(self):
-        """Test profile determination for low impact."""
-        from src.mcp_servers.control_mapper.server import determine_profile
-
-        categorization = {
-            "confidentiality": "Low",
-            "integrity": "Low",
-            "availability": "Low",
-        }
-
-        result = await determine_profile(categorization)
-
-        assert result["profile"] == 1
-
-    @pytest.mark.asyncio
-    async def test_determine_profile_moderate(self):
-        """Test profile determination for moderate impact."""
-        from src.mcp_servers.control_mapper.server import determine_profile
-
-        categorization = {
-            "confidentiality": "Moderate",
-            "integrity": "Low",
-            "availability": "Low",
-        }
-
-        result = await determine_profile(categorization)
+    async def test_determine_profile(self):
+        """Test profile determination for low, moderate and high impact."""
+        cases = [(_CAT_LOW, 1), (_CAT_MOD, 2), (_CAT_HIGH, 3)]
 
-        assert result["profile"] == 2
+        results = await asyncio.gather(*(determine_profile(c) for c, _ in cases))
 
-    @pytest.mark.asyncio
-    async def test_determine_profile_high(self):
-        """Test profile determination for high impact."""
-        from src.mcp_servers.control_mapper.server import determine_profile
-
-        categorization = {
-            "confidentiality": "High",
-            "integrity": "Low",
-            "availability": "Moderate",
-        }
-
-        result = await determine_profile(categorization)
-
-        assert result["profile"] == 3
+        for (_, expected), result in zip(cases, results):
+            assert result["profile"] == expected
 
 
 class TestControlMapperTools:
@@ -96,8 +91,6 @@ class TestControlMapperTools:
 
     def test_calculate_impact_level_high(self):
         """Test high impact calculation."""
-        from src.mcp_servers.control_mapper.tools import calculate_impact_level
-
         factors = ["national security", "classified data"]
         result = calculate_impact_level(factors)
 
@@ -105,8 +98,6 @@ class TestControlMapperTools:
 
     def test_calculate_impact_level_moderate(self):
         """Test moderate impact calculation."""
-        from src.mcp_servers.control_mapper.tools import calculate_impact_level
-
         factors = ["protected b", "financial data"]
         result = calculate_impact_level(factors)
 
@@ -114,8 +105,6 @@ class TestControlMapperTools:
 
     def test_calculate_impact_level_low(self):
         """Test low impact calculation."""
-        from src.mcp_servers.control_mapper.tools import calculate_impact_level
-
         factors = ["public information"]
         result = calculate_impact_level(factors)
 
@@ -123,8 +112,6 @@ class TestControlMapperTools:
 
     def test_get_baseline_controls_profile_1(self):
         """Test baseline controls for profile 1."""
-        from src.mcp_servers.control_mapper.tools import get_baseline_controls
-
         controls = get_baseline_controls(1)
 
         assert isinstance(controls, list)
@@ -137,16 +124,12 @@ class TestGapAnalyzerTools:
 
     def test_calculate_severity_critical(self):
         """Test critical severity calculation."""
-        from src.mcp_servers.gap_analyzer.tools import calculate_severity, GapSeverity
-
         severity = calculate_severity("AC", "Not Implemented", "High")
 
         assert severity == GapSeverity.CRITICAL
 
     def test_calculate_compliance_score(self):
         """Test compliance score calculation."""
-        from src.mcp_servers.gap_analyzer.tools import calculate_compliance_score
-
         result = calculate_compliance_score(
             total_controls=100,
             implemented=50,
@@ -156,3 +139,38 @@ class TestGapAnalyzerTools:
 
         assert result["percentage"] == 60.0
         assert result["status"] == "Acceptable"
+
+
+class TestReportGeneratorTools:
+    """Tests for Report Generator tools."""
+
+    def test_generate_findings_section_groups_by_severity(self):
+        """Test findings are grouped by severity, most severe first."""
+        def make_gap(control_id: str, severity: str) -> Gap:
+            return Gap(
+                gap_id=f"GAP-{control_id}",
+                control_id=control_id,
+                control_name="Test Control",
+                gap_type="Implementation",
+                severity=severity,
+                description=f"{control_id} gap",
+                impact="Test impact",
+                recommendation="Test recommendation",
+            )
+
+        gaps = [
+            make_gap("AC-2", "Low"),
+            make_gap("AU-1", "Critical"),
+            make_gap("IA-2", "Informational"),
+            make_gap("SC-7", "Critical"),
+        ]
+
+        result = generate_findings_section(gaps)
+
+        assert result == (
+            "### Critical Findings\n"
+            "1. **AU-1**: AU-1 gap\n"
+            "2. **SC-7**: SC-7 gap\n"
+            "\n### Low Severity Findings\n"
+            "1. **AC-2**: AC-2 gap\n"
+        )